@@ -0,0 +1,21 @@
+"""
+Package-wide path constants for EnergyPlus MCP Server
+
+EnergyPlus Model Context Protocol Server (EnergyPlus-MCP)
+Copyright (c) 2025, The Regents of the University of California,
+through Lawrence Berkeley National Laboratory (subject to receipt of
+any required approvals from the U.S. Dept. of Energy). All rights reserved.
+
+See License.txt in the parent directory for license details.
+"""
+
+import os
+
+# Project root (parent of the energyplus_mcp_server package), computed once
+# with plain string operations at import time
+PROJECT_ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Project-level files and directories
+ENV_FILE: str = os.path.join(PROJECT_ROOT, ".env")
+SCHEMAS_DIR: str = os.path.join(PROJECT_ROOT, "schemas")
+BUILDING_SCHEMA_PATH: str = os.path.join(SCHEMAS_DIR, "building_specification.json")
@@ -12,23 +12,79 @@ See License.txt in the parent directory for license details.
 import os
 import sys
 import logging
+import functools
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Set
 
+from ._paths import PROJECT_ROOT
 
-# Determine project root (parent of the energyplus_mcp_server package)
-PROJECT_ROOT = Path(__file__).parent.parent.resolve()
+# The platform cannot change while the process is running
+_IS_WINDOWS = sys.platform == "win32"
+
+# Log level names accepted in ServerConfig.log_level
+_LEVEL_MAP = {
+    "CRITICAL": logging.CRITICAL,
+    "ERROR": logging.ERROR,
+    "WARNING": logging.WARNING,
+    "INFO": logging.INFO,
+    "DEBUG": logging.DEBUG,
+    "NOTSET": logging.NOTSET,
+}
+
+# Set once the root logger handlers have been installed, so that
+# reload_config() does not stack duplicate console/file handlers
+_LOGGING_CONFIGURED = False
 
 
 def _is_windows() -> bool:
     """Check if running on Windows"""
-    return sys.platform == "win32"
+    return _IS_WINDOWS
+
+
+# Trailing separators stripped from base paths before joining
+_PATH_SEPARATORS = "/\\"
+
+
+def _join_path(base: str, name: str) -> str:
+    """
+    Join a relative file or directory name onto a base path.
+
+    Cheaper than os.path.join for the fixed, relative names used here.
+    Forward slashes are accepted by both POSIX and Windows.
+    """
+    if not base:
+        return name
+    return f"{base.rstrip(_PATH_SEPARATORS)}/{name}"
 
 
+def _dir_children(path: str) -> Optional[Set[str]]:
+    """Return the entry names of a directory, or None if it cannot be listed"""
+    if not path:
+        return None
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return None
+
+
+def _is_child_of(path: str, parent: str) -> bool:
+    """Check whether path names an entry directly inside parent"""
+    return bool(parent) and os.path.dirname(path).rstrip(_PATH_SEPARATORS) == parent.rstrip(_PATH_SEPARATORS)
+
+
+@functools.lru_cache(maxsize=1)
 def _get_platform_defaults() -> Dict[str, Any]:
-    """Get platform-appropriate default paths and settings"""
-    if _is_windows():
+    """
+    Get platform-appropriate default paths and settings.
+
+    The result is cached for the lifetime of the process, so the Windows
+    installation search only probes the filesystem once. Environment-dependent
+    values (such as the Windows TEMP directory) are resolved by the caller.
+    """
+    if _IS_WINDOWS:
         # Windows defaults
         # Check common EnergyPlus installation locations
         possible_ep_paths = [
@@ -49,8 +105,8 @@ def _get_platform_defaults() -> Dict[str, Any]:
 
         return {
             "energyplus_install": ep_install,
-            "workspace_root": str(PROJECT_ROOT),
-            "temp_dir": os.environ.get("TEMP", os.environ.get("TMP", "C:/Temp")),
+            "workspace_root": PROJECT_ROOT,
+            "temp_dir": "C:/Temp",
             "executable_name": "energyplus.exe",
         }
     else:
@@ -63,7 +119,66 @@ def _get_platform_defaults() -> Dict[str, Any]:
         }
 
 
-@dataclass
+_DEFAULT_WEATHER_FILENAME = "USA_CA_San.Francisco.Intl.AP.724940_TMY3.epw"
+
+
+@functools.lru_cache(maxsize=16)
+def _resolve_energyplus_paths(
+    ep_install_path: Optional[str],
+    ep_idd_path: Optional[str],
+    ep_weather_path: Optional[str],
+    ep_example_files_path: Optional[str],
+    default_weather_filename: str
+) -> Dict[str, str]:
+    """
+    Derive the EnergyPlus paths from the EPLUS_* environment values.
+
+    Cached on the raw values, so repeated Config() construction (e.g. via
+    reload_config()) is free while the environment is unchanged and is
+    recomputed as soon as any of the variables changes. The returned dict
+    is shared and must not be mutated.
+    """
+    defaults = _get_platform_defaults()
+
+    # Determine EnergyPlus installation path
+    # Priority: EPLUS_INSTALL_PATH env var > EPLUS_IDD_PATH parent dir > platform default
+    if ep_install_path:
+        # Explicit installation path provided
+        install_path = ep_install_path
+    elif ep_idd_path:
+        # Derive installation path from IDD path
+        install_path = os.path.dirname(ep_idd_path)
+    else:
+        # Use platform-appropriate default
+        install_path = defaults["energyplus_install"]
+
+    # Set weather data path
+    if ep_weather_path is None:
+        ep_weather_path = _join_path(install_path, "WeatherData")
+
+    # Set example files path
+    if ep_example_files_path is None:
+        ep_example_files_path = _join_path(install_path, "ExampleFiles")
+
+    # Set default weather file
+    # If it's just a filename, join with weather data path
+    if os.path.dirname(default_weather_filename) == "":
+        default_weather_file = _join_path(ep_weather_path, default_weather_filename)
+    else:
+        default_weather_file = default_weather_filename
+
+    return {
+        "installation_path": install_path,
+        "idd_path": ep_idd_path or _join_path(install_path, "Energy+.idd"),
+        # Platform-aware executable name (.exe on Windows)
+        "executable_path": _join_path(install_path, defaults["executable_name"]),
+        "weather_data_path": ep_weather_path,
+        "example_files_path": ep_example_files_path,
+        "default_weather_file": default_weather_file,
+    }
+
+
+@dataclass(slots=True)
 class EnergyPlusConfig:
     """EnergyPlus-specific configuration"""
     idd_path: str = ""
@@ -75,7 +190,7 @@ class EnergyPlusConfig:
     example_files_path: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class PathConfig:
     """Path configuration"""
     workspace_root: str = ""
@@ -96,10 +211,10 @@ class PathConfig:
 
         # Set temp directory from env var or platform default
         if not self.temp_dir:
-            self.temp_dir = os.environ.get(
-                "MCP_TEMP_DIR",
-                defaults["temp_dir"]
-            )
+            default_temp_dir = defaults["temp_dir"]
+            if _IS_WINDOWS:
+                default_temp_dir = os.environ.get("TEMP", os.environ.get("TMP", default_temp_dir))
+            self.temp_dir = os.environ.get("MCP_TEMP_DIR", default_temp_dir)
 
         # Set output directory from env var or derive from workspace
         if not self.output_dir:
@@ -116,7 +231,7 @@ class PathConfig:
             )
 
 
-@dataclass
+@dataclass(slots=True)
 class ServerConfig:
     """Server configuration"""
     name: str = "energyplus-mcp-server"
@@ -126,7 +241,7 @@ class ServerConfig:
     tool_timeout: int = 60  # seconds
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Main configuration class"""
     energyplus: EnergyPlusConfig = field(default_factory=EnergyPlusConfig)
@@ -142,103 +257,58 @@ class Config:
 
     def _setup_energyplus_paths(self):
         """Set up EnergyPlus paths from environment variables or platform defaults"""
-        defaults = _get_platform_defaults()
-
-        # Determine EnergyPlus installation path
-        # Priority: EPLUS_INSTALL_PATH env var > EPLUS_IDD_PATH parent dir > platform default
-        ep_install_path = os.getenv('EPLUS_INSTALL_PATH')
-        ep_idd_path = os.getenv('EPLUS_IDD_PATH')
-
-        if ep_install_path:
-            # Explicit installation path provided
-            self.energyplus.installation_path = ep_install_path
-        elif ep_idd_path:
-            # Derive installation path from IDD path
-            self.energyplus.installation_path = os.path.dirname(ep_idd_path)
-        else:
-            # Use platform-appropriate default
-            self.energyplus.installation_path = defaults["energyplus_install"]
-
-        # Set IDD path
-        if ep_idd_path:
-            self.energyplus.idd_path = ep_idd_path
-        else:
-            self.energyplus.idd_path = os.path.join(
-                self.energyplus.installation_path, "Energy+.idd"
-            )
-
-        # Set executable path (platform-aware: .exe on Windows)
-        self.energyplus.executable_path = os.path.join(
-            self.energyplus.installation_path, defaults["executable_name"]
+        # Read all EnergyPlus environment overrides in one pass; the derived
+        # paths are cached per distinct set of values
+        env = os.environ
+        paths = _resolve_energyplus_paths(
+            env.get('EPLUS_INSTALL_PATH'),
+            env.get('EPLUS_IDD_PATH'),
+            env.get('EPLUS_WEATHER_PATH'),
+            env.get('EPLUS_EXAMPLE_FILES_PATH'),
+            env.get('EPLUS_DEFAULT_WEATHER_FILE', _DEFAULT_WEATHER_FILENAME)
         )
 
-        # Set weather data path
-        self.energyplus.weather_data_path = os.environ.get(
-            'EPLUS_WEATHER_PATH',
-            os.path.join(self.energyplus.installation_path, "WeatherData")
-        )
-
-        # Set example files path
-        self.energyplus.example_files_path = os.environ.get(
-            'EPLUS_EXAMPLE_FILES_PATH',
-            os.path.join(self.energyplus.installation_path, "ExampleFiles")
-        )
-
-        # Set default weather file
-        default_weather_filename = os.environ.get(
-            'EPLUS_DEFAULT_WEATHER_FILE',
-            "USA_CA_San.Francisco.Intl.AP.724940_TMY3.epw"
-        )
-        # If it's just a filename, join with weather data path
-        if os.path.dirname(default_weather_filename) == "":
-            self.energyplus.default_weather_file = os.path.join(
-                self.energyplus.weather_data_path,
-                default_weather_filename
-            )
-        else:
-            self.energyplus.default_weather_file = default_weather_filename
-
-    def _setup_logging(self):
-        """Configure logging based on configuration"""
-        log_level = getattr(logging, self.server.log_level.upper(), logging.INFO)
-        
-        # Configure logging format
-        logging.basicConfig(
-            level=log_level,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        
-        logger = logging.getLogger(__name__)
-        logger.info(f"Logging configured: level={self.server.log_level}")
+        for name, value in paths.items():
+            setattr(self.energyplus, name, value)
 
     def _validate_config(self):
         """Validate configuration and log warnings for missing components"""
         logger = logging.getLogger(__name__)
-        
+
+        # Most EnergyPlus paths live directly in the installation directory,
+        # so list it once and check membership instead of stat-ing each path
+        install_path = self.energyplus.installation_path
+        install_children = _dir_children(install_path)
+
+        def exists(path: str) -> bool:
+            if install_children is not None and _is_child_of(path, install_path):
+                return os.path.basename(path) in install_children
+            return os.path.exists(path)
+
         # Check EnergyPlus installation
-        if not os.path.exists(self.energyplus.idd_path):
-            logger.warning(f"EnergyPlus IDD file not found: {self.energyplus.idd_path}")
+        if not exists(self.energyplus.idd_path):
+            logger.warning("EnergyPlus IDD file not found: %s", self.energyplus.idd_path)
         
-        if not os.path.exists(self.energyplus.executable_path):
-            logger.warning(f"EnergyPlus executable not found: {self.energyplus.executable_path}")
+        if not exists(self.energyplus.executable_path):
+            logger.warning("EnergyPlus executable not found: %s", self.energyplus.executable_path)
         
         # Check weather data
-        if not os.path.exists(self.energyplus.weather_data_path):
-            logger.warning(f"EnergyPlus weather data directory not found: {self.energyplus.weather_data_path}")
+        if not exists(self.energyplus.weather_data_path):
+            logger.warning("EnergyPlus weather data directory not found: %s", self.energyplus.weather_data_path)
         
         if not os.path.exists(self.energyplus.default_weather_file):
-            logger.warning(f"Default weather file not found: {self.energyplus.default_weather_file}")
+            logger.warning("Default weather file not found: %s", self.energyplus.default_weather_file)
         
         # Check example files
-        if not os.path.exists(self.energyplus.example_files_path):
-            logger.warning(f"EnergyPlus example files directory not found: {self.energyplus.example_files_path}")
+        if not exists(self.energyplus.example_files_path):
+            logger.warning("EnergyPlus example files directory not found: %s", self.energyplus.example_files_path)
         
         # Check sample files directory
         if not os.path.exists(self.paths.sample_files_path):
-            logger.warning(f"Sample files directory not found: {self.paths.sample_files_path}")
+            logger.warning("Sample files directory not found: %s", self.paths.sample_files_path)
         
-        # Create output directory if it doesn't exist
+        # Create output directory if it doesn't exist. Not remembered between
+        # Config instances: the directory may be removed while the server runs
         os.makedirs(self.paths.output_dir, exist_ok=True)
         
         logger.info("Configuration loaded and validated successfully")
@@ -246,17 +316,22 @@ class Config:
     def _setup_logging(self):
         """Set up logging configuration with both console and file handlers"""
         import logging.handlers
-        from pathlib import Path
+        global _LOGGING_CONFIGURED
 
         logger = logging.getLogger(__name__)
 
-        # Create logs directory
         log_dir = Path(self.paths.workspace_root) / "logs"
-        log_dir.mkdir(exist_ok=True)
 
         # Configure root logger
         root_logger = logging.getLogger()
-        root_logger.setLevel(getattr(logging, self.server.log_level))
+        root_logger.setLevel(_LEVEL_MAP.get(self.server.log_level.upper(), logging.INFO))
+
+        # Handlers are only installed once per process; later calls just update the level
+        if _LOGGING_CONFIGURED:
+            return log_dir
+
+        # Create logs directory
+        os.makedirs(log_dir, exist_ok=True)
 
         # Clear existing handlers
         for handler in root_logger.handlers[:]:
@@ -274,7 +349,7 @@ class Config:
         # File handler for all logs
         # On Windows, use TimedRotatingFileHandler to avoid file locking issues
         # with uvicorn's reload feature (multiple processes accessing same file)
-        if _is_windows():
+        if _IS_WINDOWS:
             # Use a simpler FileHandler on Windows to avoid rotation locking issues
             # Files will be rotated manually or by date
             file_handler = logging.handlers.TimedRotatingFileHandler(
@@ -298,7 +373,7 @@ class Config:
         root_logger.addHandler(file_handler)
 
         # Separate error log file
-        if _is_windows():
+        if _IS_WINDOWS:
             error_handler = logging.handlers.TimedRotatingFileHandler(
                 log_dir / "energyplus_mcp_errors.log",
                 when='midnight',
@@ -316,22 +391,32 @@ class Config:
         error_handler.setFormatter(file_formatter)
         root_logger.addHandler(error_handler)
 
-        logger.info(f"Logging configured: level={self.server.log_level}")
-        logger.info(f"Log files: {log_dir}")
+        _LOGGING_CONFIGURED = True
+
+        logger.info("Logging configured: level=%s", self.server.log_level)
+        logger.info("Log files: %s", log_dir)
 
         return log_dir
 
 
+# Global configuration instance, created on first access
+_CONFIG: Optional[Config] = None
+_CONFIG_LOCK = threading.Lock()
+
+
 def get_config() -> Config:
     """Get the global configuration instance"""
-    if not hasattr(get_config, '_config'):
-        get_config._config = Config()
-    
-    return get_config._config
+    global _CONFIG
+    if _CONFIG is None:
+        with _CONFIG_LOCK:
+            if _CONFIG is None:
+                _CONFIG = Config()
+
+    return _CONFIG
 
 
 def reload_config() -> Config:
     """Reload configuration (useful for testing)"""
-    if hasattr(get_config, '_config'):
-        delattr(get_config, '_config')
+    global _CONFIG
+    _CONFIG = None
     return get_config()
@@ -13,25 +13,39 @@ Usage:
 """
 
 import os
-import json
+import re
+import asyncio
+import time
 import logging
-from typing import Optional, List, Dict, Any
+import mmap
+import functools
+import importlib.util
+import threading
+from contextlib import asynccontextmanager
+from typing import Optional, List, Dict, Any, Iterator, Literal, Tuple
 from datetime import datetime
 from pathlib import Path
 
-from dotenv import load_dotenv
+import orjson
 
-# Load .env file from project root
-load_dotenv(Path(__file__).parent.parent / ".env")
+from energyplus_mcp_server._paths import ENV_FILE, BUILDING_SCHEMA_PATH
 
-from fastapi import FastAPI, HTTPException
+# Load .env file from project root, once per process tree. Deployments that
+# provide real environment variables can set MCP_DOTENV_LOADED=1 to skip it.
+if os.environ.get("MCP_DOTENV_LOADED") != "1":
+    from dotenv import load_dotenv
+    load_dotenv(ENV_FILE)
+    os.environ["MCP_DOTENV_LOADED"] = "1"
+
+from fastapi import Depends, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
-from pydantic import BaseModel, Field
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
 
 # Import our existing components
 from energyplus_mcp_server.energyplus_tools import EnergyPlusManager
-from energyplus_mcp_server.config import get_config
+from energyplus_mcp_server.config import get_config, ServerConfig
 from energyplus_mcp_server.utils.weather_lookup import WeatherLookup, WeatherLookupError
 from energyplus_mcp_server.utils.template_service import TemplateService, TemplateServiceError
 from energyplus_mcp_server.utils.gdrive_service import GDriveService, GDriveServiceError
@@ -41,16 +55,246 @@ from energyplus_mcp_server.utils.supabase_service import SupabaseStorageService,
 # Initialize logging
 logger = logging.getLogger(__name__)
 
-# Initialize configuration
-config = get_config()
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response serialized with orjson.
+
+    Non-string dict keys and NumPy arrays are serialized directly, so
+    results do not need a conversion pass before being returned.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+# Characters not allowed in generated output filenames
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w-]")
+
+# Last second a filename timestamp was issued for, and how many times
+_timestamp_lock = threading.Lock()
+_timestamp_second = 0
+_timestamp_count = 0
+
+
+@functools.lru_cache(maxsize=2)
+def _format_timestamp(second: int) -> str:
+    """Format an epoch second as used in generated filenames"""
+    return time.strftime("%Y%m%d_%H%M%S", time.localtime(second))
+
+
+def _filename_timestamp() -> str:
+    """
+    Timestamp for generated filenames, e.g. 20250105_143000.
+
+    Repeat calls within the same second get a _1, _2, ... suffix so that
+    bursts of requests do not overwrite each other's files.
+    """
+    global _timestamp_second, _timestamp_count
+    second = int(time.time())
+    with _timestamp_lock:
+        if second == _timestamp_second:
+            _timestamp_count += 1
+        else:
+            _timestamp_second = second
+            _timestamp_count = 0
+        count = _timestamp_count
+
+    timestamp = _format_timestamp(second)
+    return f"{timestamp}_{count}" if count else timestamp
+
+
+# Request fields passed to generate_model separately rather than in the spec
+_GENERATE_EXCLUDE = frozenset({"template_id", "output_filename"})
+
+# Media types for file downloads, by lowercase extension
+_MEDIA_TYPES = {
+    ".csv": "text/csv",
+    ".html": "text/html",
+    ".htm": "text/html",
+    ".json": "application/json",
+    ".idf": "text/plain",
+    ".epw": "text/plain",
+    ".sql": "application/x-sqlite3",
+    ".obj": "model/obj",
+    ".mtl": "text/plain",
+    ".glb": "model/gltf-binary",
+    ".gltf": "model/gltf+json",
+    ".txt": "text/plain",
+    ".err": "text/plain",
+    ".eso": "text/plain",
+    ".eio": "text/plain",
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _load_json_cached(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a JSON file; the mtime key invalidates the entry when the file changes"""
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
+
+
+def load_json(path: str) -> Dict[str, Any]:
+    """
+    Load a static JSON file (schema, template metadata) with caching.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+    path = os.fspath(path)
+    return _load_json_cached(path, os.stat(path).st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=4)
+def _resolved_dir(path: str) -> Path:
+    """Resolve a configured directory once; keyed on the path so a reloaded config takes effect"""
+    return Path(path).resolve()
+
+
+def _in_outputs_dir(path: Path) -> bool:
+    """Whether path (after resolving symlinks and ..) lies inside the outputs directory"""
+    return path.resolve().is_relative_to(_resolved_dir(get_config().paths.output_dir))
+
+
+# pandas and numpy are only needed for meter data; they are bound here on
+# first use so server startup does not pay for importing them
+pd = None
+np = None
+
+
+def _load_pandas() -> None:
+    """Import pandas and numpy into the module globals if not done yet"""
+    global pd, np
+    if pd is None:
+        import numpy
+        import pandas
+        np = numpy
+        pd = pandas
+
+
+# pyarrow is optional; when installed its multithreaded CSV reader is used
+# for meter files, which can be several MB for annual hourly runs
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+# polars is optional too; when installed, meter totals come from a lazy
+# scan that sums the columns without building a DataFrame
+_HAS_POLARS = importlib.util.find_spec("polars") is not None
+
+
+def _read_meter_csv(path):
+    """Read an EnergyPlus meter CSV into a DataFrame"""
+    _load_pandas()
+    if _HAS_PYARROW:
+        return pd.read_csv(path, engine="pyarrow")
+    return pd.read_csv(path)
+
+
+def _polars_column_totals(path: str) -> Dict[str, float]:
+    """Sum the numeric meter columns of a meter CSV with a polars lazy scan"""
+    import polars as pl
+    import polars.selectors as cs
+
+    # Infer types from the whole file, as pandas does, so a meter that is
+    # integral in its first rows does not fail to parse later
+    lf = pl.scan_csv(path, infer_schema_length=None)
+    totals = lf.select((cs.numeric() - cs.first()).sum()).collect()
+    return {col: float(total) for col, total in totals.row(0, named=True).items()}
+
+
+@functools.lru_cache(maxsize=64)
+def _meter_totals_cached(path: str, mtime_ns: int, size: int) -> Dict[str, float]:
+    """Per-meter column sums; the mtime/size key invalidates the entry when the file changes"""
+    if _HAS_POLARS:
+        return _polars_column_totals(path)
+
+    df = _read_meter_csv(path)
+    # One vectorized reduction over every meter column, skipping Date/Time;
+    # a column that is not numeric is left out rather than failing the sum
+    column_totals = df.iloc[:, 1:].sum(numeric_only=True)
+    return {col: float(total) for col, total in column_totals.items()}
+
+
+def _meter_column_totals(path) -> Dict[str, float]:
+    """
+    Sum of each meter column in a meter CSV, in joules.
+
+    Shared by the results and summary endpoints so a run is parsed once
+    for both. The returned dict must not be mutated.
+    """
+    path = os.fspath(path)
+    st = os.stat(path)
+    return _meter_totals_cached(path, st.st_mtime_ns, st.st_size)
+
+
+def _scan_err_file(path) -> Tuple[List[str], List[str]]:
+    """
+    Collect warning and error lines from an eplusout.err file.
+
+    The file is streamed in a single pass, so large error files are never
+    held in memory as one string.
+
+    Returns:
+        Tuple of (warning lines, severe/fatal lines), stripped
+    """
+    warnings = []
+    errors = []
+    with open(path, "r", encoding="utf-8", errors="ignore", buffering=1 << 20) as f:
+        for line in f:
+            if "** Warning **" in line:
+                warnings.append(line.strip())
+            elif "** Severe **" in line or "** Fatal **" in line:
+                errors.append(line.strip())
+    return warnings, errors
+
+
+# Message markers counted by _count_err_messages
+_ERR_MESSAGE_MARKER = re.compile(rb"\*\* (Warning|Severe|Fatal) \*\*")
+
+
+def _count_err_messages(path) -> Tuple[int, int]:
+    """
+    Count warnings and severe/fatal errors in an eplusout.err file.
+
+    All three markers are matched in one regex pass over the memory-mapped
+    bytes, without decoding the file.
+
+    Returns:
+        Tuple of (warning count, severe + fatal count)
+    """
+    warnings = 0
+    errors = 0
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return 0, 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for match in _ERR_MESSAGE_MARKER.finditer(mm):
+                if match.group(1) == b"Warning":
+                    warnings += 1
+                else:
+                    errors += 1
+    return warnings, errors
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup/shutdown hooks"""
+    # Generate the OpenAPI schema once at startup; FastAPI keeps it in
+    # app.openapi_schema and serves that copy for /openapi.json and /docs
+    app.openapi_schema = app.openapi()
+    yield
+
 
 # Initialize FastAPI app
+# The server version is a static default, so the full configuration does not
+# need to be loaded (and validated) just to build the app. ServerConfig is a
+# slotted dataclass, so the default is read from an instance.
 app = FastAPI(
     title="EnergyPlus HTTP API",
     description="REST API for EnergyPlus building energy simulation - designed for n8n workflow integration",
-    version=config.server.version,
+    version=ServerConfig().version,
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Add CORS middleware for n8n access
@@ -62,19 +306,100 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize services (reuse from MCP server)
-ep_manager = EnergyPlusManager(config)
-template_service = TemplateService()
-weather_lookup = WeatherLookup(
-    output_dir=os.path.join(config.paths.output_dir, "weather_files")
-)
+# Compress responses for clients that accept gzip; results and time-series
+# JSON (repeated meter names, numbers as text) shrinks several-fold
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Services (reused from MCP server) are created on first use rather than at
+# import time, so uvicorn binds its port quickly and configuration problems
+# surface as HTTP errors instead of import failures
+_services_lock = threading.Lock()
+_ep_manager: Optional[EnergyPlusManager] = None
+_template_service: Optional[TemplateService] = None
+_weather_lookup: Optional[WeatherLookup] = None
+_gdrive_service: Optional[GDriveService] = None
+_supabase_service: Optional[SupabaseStorageService] = None
+
+
+def _get_ep_manager() -> EnergyPlusManager:
+    """Get or create the shared EnergyPlusManager"""
+    global _ep_manager
+    if _ep_manager is None:
+        with _services_lock:
+            if _ep_manager is None:
+                _ep_manager = EnergyPlusManager(get_config())
+    return _ep_manager
+
+
+def get_ep_manager() -> EnergyPlusManager:
+    """
+    FastAPI dependency providing the shared EnergyPlusManager.
+
+    The manager is built on the first request that needs it; a failure to
+    build it (e.g. missing IDD) is reported as an HTTP 500 with the cause.
+    """
+    try:
+        return _get_ep_manager()
+    except Exception as e:
+        logger.error("EnergyPlus manager initialization error: %s", e)
+        raise HTTPException(status_code=500, detail=f"EnergyPlus manager unavailable: {str(e)}")
+
+
+def _get_template_service() -> TemplateService:
+    """Get or create the shared TemplateService"""
+    global _template_service
+    if _template_service is None:
+        with _services_lock:
+            if _template_service is None:
+                _template_service = TemplateService()
+    return _template_service
+
+
+def _get_weather_lookup() -> WeatherLookup:
+    """Get or create the shared WeatherLookup"""
+    global _weather_lookup
+    if _weather_lookup is None:
+        with _services_lock:
+            if _weather_lookup is None:
+                _weather_lookup = WeatherLookup(
+                    output_dir=os.path.join(get_config().paths.output_dir, "weather_files")
+                )
+    return _weather_lookup
+
+
+def _get_gdrive_service() -> GDriveService:
+    """Get or create the shared GDriveService, which keeps its credentials and clients"""
+    global _gdrive_service
+    if _gdrive_service is None:
+        with _services_lock:
+            if _gdrive_service is None:
+                _gdrive_service = GDriveService()
+    return _gdrive_service
+
+
+def _get_supabase_service() -> SupabaseStorageService:
+    """
+    Get or create the shared SupabaseStorageService, whose client keeps a
+    connection pool. Raises SupabaseServiceError if Supabase is not configured.
+    """
+    global _supabase_service
+    if _supabase_service is None:
+        with _services_lock:
+            if _supabase_service is None:
+                _supabase_service = SupabaseStorageService()
+    return _supabase_service
 
 
 # =============================================================================
 # Pydantic Models for Request/Response Validation
 # =============================================================================
 
-class LocationModel(BaseModel):
+class RequestModel(BaseModel):
+    """Base class for request models: immutable, unknown fields are dropped"""
+    model_config = ConfigDict(frozen=True, extra="ignore", populate_by_name=True)
+
+
+class LocationModel(RequestModel):
     """Location specification"""
     latitude: float = Field(..., ge=-90, le=90, description="Latitude in decimal degrees")
     longitude: float = Field(..., ge=-180, le=180, description="Longitude in decimal degrees")
@@ -83,7 +408,7 @@ class LocationModel(BaseModel):
     catchment_area: Optional[str] = Field(None, description="Catchment area identifier")
 
 
-class GeometryModel(BaseModel):
+class GeometryModel(RequestModel):
     """Building geometry specification"""
     floor_area_m2: Optional[float] = Field(None, ge=50, le=100000, description="Total floor area in m²")
     length_m: Optional[float] = Field(None, ge=5, le=500, description="Building length in meters")
@@ -93,7 +418,7 @@ class GeometryModel(BaseModel):
     orientation_deg: Optional[float] = Field(None, ge=0, le=360, description="Building rotation from north")
 
 
-class DataCenterSpecModel(BaseModel):
+class DataCenterSpecModel(RequestModel):
     """Data center specific parameters"""
     it_load_kw: Optional[float] = Field(None, ge=1, le=100000, description="Total IT load in kW")
     target_pue: Optional[float] = Field(None, ge=1.0, le=3.0, description="Target PUE")
@@ -103,7 +428,7 @@ class DataCenterSpecModel(BaseModel):
     watts_per_rack: Optional[float] = Field(None, ge=100, le=50000, description="Average power per rack")
 
 
-class ManufacturingSpecModel(BaseModel):
+class ManufacturingSpecModel(RequestModel):
     """Manufacturing facility specific parameters"""
     process_type: Optional[str] = Field(None, description="Type of manufacturing process")
     process_load_kw: Optional[float] = Field(None, ge=0, le=100000, description="Process equipment load in kW")
@@ -113,13 +438,13 @@ class ManufacturingSpecModel(BaseModel):
     occupancy_count: Optional[int] = Field(None, ge=0, le=10000, description="Number of occupants")
 
 
-class SetpointsModel(BaseModel):
+class SetpointsModel(RequestModel):
     """Temperature setpoints"""
     cooling_setpoint_c: Optional[float] = Field(None, ge=15, le=35, description="Cooling setpoint in °C")
     heating_setpoint_c: Optional[float] = Field(None, ge=10, le=25, description="Heating setpoint in °C")
 
 
-class SimulationOptionsModel(BaseModel):
+class SimulationOptionsModel(RequestModel):
     """Simulation configuration"""
     run_annual: bool = Field(False, description="Run full annual simulation")
     run_design_days: bool = Field(True, description="Run design day simulations")
@@ -127,7 +452,7 @@ class SimulationOptionsModel(BaseModel):
     detailed_outputs: bool = Field(False, description="Generate detailed hourly outputs")
 
 
-class BuildingSpecRequest(BaseModel):
+class BuildingSpecRequest(RequestModel):
     """Complete building specification for model generation"""
     project_id: Optional[str] = Field(None, description="Unique project identifier")
     project_name: Optional[str] = Field(None, description="Human-readable project name")
@@ -142,14 +467,14 @@ class BuildingSpecRequest(BaseModel):
     output_filename: Optional[str] = Field(None, description="Output IDF filename")
 
 
-class WeatherFetchRequest(BaseModel):
+class WeatherFetchRequest(RequestModel):
     """Request for weather file fetch"""
     latitude: float = Field(..., ge=-90, le=90, description="Site latitude")
     longitude: float = Field(..., ge=-180, le=180, description="Site longitude")
     location_name: Optional[str] = Field(None, description="Location name for file naming")
 
 
-class SimulationRunRequest(BaseModel):
+class SimulationRunRequest(RequestModel):
     """Request to run EnergyPlus simulation"""
     idf_path: str = Field(..., description="Path to IDF file")
     weather_file: Optional[str] = Field(None, description="Path to EPW weather file")
@@ -160,13 +485,13 @@ class SimulationRunRequest(BaseModel):
     expandobjects: bool = Field(True, description="Expand HVAC templates")
 
 
-class GDriveExportRequest(BaseModel):
+class GDriveExportRequest(RequestModel):
     """Request to export simulation results to Google Drive"""
     source_folder: str = Field(..., description="Path to local simulation output folder")
     destination_folder: str = Field(..., description="Google Drive folder URL or ID")
 
 
-class SupabaseExportRequest(BaseModel):
+class SupabaseExportRequest(RequestModel):
     """Request to export simulation results to Supabase storage"""
     source_folder: str = Field(..., description="Path to local simulation output folder")
     destination_folder: Optional[str] = Field(
@@ -182,6 +507,7 @@ class SupabaseExportRequest(BaseModel):
 @app.get("/")
 async def root():
     """API root - returns server info"""
+    config = get_config()
     return {
         "name": "EnergyPlus HTTP API",
         "version": config.server.version,
@@ -200,6 +526,7 @@ async def root():
 @app.get("/health")
 async def health_check():
     """Health check endpoint for monitoring"""
+    config = get_config()
     return {
         "status": "healthy",
         "timestamp": datetime.now().isoformat(),
@@ -220,7 +547,7 @@ async def fetch_weather(request: WeatherFetchRequest):
     Downloads TMY weather data from PVGIS API and saves as EPW file.
     """
     try:
-        result = weather_lookup.fetch_weather_by_location(
+        result = _get_weather_lookup().fetch_weather_by_location(
             latitude=request.latitude,
             longitude=request.longitude,
             location_name=request.location_name
@@ -229,7 +556,7 @@ async def fetch_weather(request: WeatherFetchRequest):
     except WeatherLookupError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error(f"Weather fetch error: {str(e)}")
+        logger.error("Weather fetch error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -237,7 +564,7 @@ async def fetch_weather(request: WeatherFetchRequest):
 async def get_weather_coverage():
     """Get information about weather data coverage regions"""
     try:
-        coverage = weather_lookup.get_coverage_info()
+        coverage = _get_weather_lookup().get_coverage_info()
         return {
             "success": True,
             "coverage_regions": coverage,
@@ -251,7 +578,7 @@ async def get_weather_coverage():
 async def check_weather_coverage(latitude: float, longitude: float):
     """Check weather data availability for a specific location"""
     try:
-        coverage = weather_lookup.check_location_coverage(latitude, longitude)
+        coverage = _get_weather_lookup().check_location_coverage(latitude, longitude)
         return {"success": True, **coverage}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -269,7 +596,7 @@ async def list_templates(building_type: Optional[str] = None):
     Optionally filter by building type (data_center, manufacturing, etc.)
     """
     try:
-        templates = template_service.list_templates(building_type)
+        templates = _get_template_service().list_templates(building_type)
         return {
             "success": True,
             "count": len(templates),
@@ -283,10 +610,8 @@ async def list_templates(building_type: Optional[str] = None):
 async def get_template_details(template_id: str):
     """Get detailed information about a specific template"""
     try:
-        template = template_service.get_template(template_id)
-
-        with open(template.metadata_path, "r", encoding="utf-8") as f:
-            metadata = json.load(f)
+        template = _get_template_service().get_template(template_id)
+        metadata = load_json(template.metadata_path)
 
         return {
             "success": True,
@@ -303,13 +628,10 @@ async def get_template_details(template_id: str):
 async def get_building_schema():
     """Get the JSON schema for building specifications"""
     try:
-        schema_path = Path(__file__).parent.parent / "schemas" / "building_specification.json"
-
-        if not schema_path.exists():
+        if not os.path.isfile(BUILDING_SCHEMA_PATH):
             raise HTTPException(status_code=404, detail="Schema not found")
 
-        with open(schema_path, "r", encoding="utf-8") as f:
-            schema = json.load(f)
+        schema = load_json(BUILDING_SCHEMA_PATH)
 
         return {"success": True, "schema": schema}
     except Exception as e:
@@ -329,7 +651,7 @@ async def generate_building_model(request: BuildingSpecRequest):
     """
     try:
         # Convert Pydantic model to dict
-        building_spec = request.model_dump(exclude_none=True, exclude={"template_id", "output_filename"})
+        building_spec = request.model_dump(exclude_none=True, exclude=_GENERATE_EXCLUDE)
 
         # Handle location conversion
         if "location" in building_spec:
@@ -339,15 +661,15 @@ async def generate_building_model(request: BuildingSpecRequest):
         output_filename = request.output_filename
         if not output_filename:
             project_name = request.project_name or "model"
-            safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in project_name)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            safe_name = _UNSAFE_FILENAME_CHARS.sub("_", project_name)
+            timestamp = _filename_timestamp()
             output_filename = f"{safe_name}_{timestamp}.idf"
 
         # Determine output path
-        output_path = os.path.join(config.paths.output_dir, "models", output_filename)
+        output_path = os.path.join(get_config().paths.output_dir, "models", output_filename)
 
         # Generate the model
-        result = template_service.generate_model(
+        result = _get_template_service().generate_model(
             building_spec=building_spec,
             output_path=output_path,
             template_id=request.template_id
@@ -358,7 +680,7 @@ async def generate_building_model(request: BuildingSpecRequest):
     except TemplateServiceError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error(f"Model generation error: {str(e)}")
+        logger.error("Model generation error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -367,7 +689,10 @@ async def generate_building_model(request: BuildingSpecRequest):
 # =============================================================================
 
 @app.post("/api/simulation/run")
-async def run_simulation(request: SimulationRunRequest):
+async def run_simulation(
+    request: SimulationRunRequest,
+    ep_manager: EnergyPlusManager = Depends(get_ep_manager)
+):
     """
     Run EnergyPlus simulation with specified IDF and weather file.
 
@@ -383,25 +708,172 @@ async def run_simulation(request: SimulationRunRequest):
             readvars=request.readvars,
             expandobjects=request.expandobjects
         )
-        return json.loads(result)
+        return orjson.loads(result)
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
-        logger.error(f"Simulation error: {str(e)}")
+        logger.error("Simulation error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/simulation/status")
 async def get_simulation_status():
     """Get current simulation status and server health"""
+    config = get_config()
+    executable_path = config.energyplus.executable_path
     return {
         "status": "ready",
-        "energyplus_available": os.path.exists(config.energyplus.executable_path) if config.energyplus.executable_path else False,
+        "energyplus_available": await asyncio.to_thread(os.path.exists, executable_path) if executable_path else False,
         "energyplus_version": config.energyplus.version,
         "timestamp": datetime.now().isoformat()
     }
 
 
+def _columnar_timeseries(df) -> Dict[str, Any]:
+    """
+    Column-oriented JSON payload for a meter DataFrame.
+
+    Returns {"columns": [...], "data": {column: values}}. Numeric columns
+    stay NumPy arrays, which ORJSONResponse serializes directly (it sets
+    OPT_SERIALIZE_NUMPY), so no per-row Python objects are created.
+    """
+    _load_pandas()
+
+    data = {}
+    for col in df.columns:
+        series = df[col]
+        if series.dtype.kind in "biuf":
+            # orjson only serializes C-contiguous arrays
+            data[col] = np.ascontiguousarray(series.to_numpy())
+        else:
+            data[col] = series.tolist()
+    return {"columns": list(df.columns), "data": data}
+
+
+def _find_meter_csv(output_path) -> Optional[str]:
+    """Path of the first *Meter.csv file in an output directory, if any"""
+    with os.scandir(output_path) as it:
+        for entry in it:
+            if entry.name.endswith("Meter.csv") and entry.is_file():
+                return entry.path
+    return None
+
+
+def _collect_simulation_results(output_directory: str, include_timeseries: bool) -> Dict[str, Any]:
+    """Parse the files in a simulation output directory (blocking)"""
+    output_path = Path(output_directory)
+    results = {
+        "success": True,
+        "output_directory": output_directory,
+        "files": {},
+        "summary": {},
+        "errors": [],
+        "warnings": []
+    }
+
+    # List all output files, noting the meter CSV on the way
+    meter_csv = None
+    with os.scandir(output_path) as it:
+        for entry in it:
+            if entry.is_file():
+                suffix = os.path.splitext(entry.name)[1].lower()
+                results["files"].setdefault(suffix, []).append(entry.name)
+                if meter_csv is None and entry.name.endswith("Meter.csv"):
+                    meter_csv = entry.path
+
+    # Parse error file for warnings/errors
+    err_file = output_path / "eplusout.err"
+    if err_file.exists():
+        warnings, errors = _scan_err_file(err_file)
+        results["warnings"].extend(warnings)
+        results["errors"].extend(errors)
+
+    # Parse end file for summary
+    end_file = output_path / "eplusout.end"
+    if end_file.exists():
+        with open(end_file, "r", encoding="utf-8", errors="ignore") as f:
+            end_content = f.read()
+            results["summary"]["completion_status"] = end_content.strip()
+
+    # Parse CSV meter data if available
+    if meter_csv:
+        try:
+            column_totals = _meter_column_totals(meter_csv)
+            # Get column names (these are the meter names)
+            results["summary"]["meters"] = list(column_totals)
+
+            # Calculate totals for energy meters
+            energy_totals = {}
+            for col, total in column_totals.items():
+                if "Electricity" in col or "Gas" in col or "Energy" in col:
+                    energy_totals[col] = {
+                        "total": total,
+                        "unit": "J"
+                    }
+            results["summary"]["energy_totals"] = energy_totals
+
+            if include_timeseries:
+                results["timeseries"] = _columnar_timeseries(_read_meter_csv(meter_csv))
+        except Exception as e:
+            results["warnings"].append(f"Could not parse meter CSV: {str(e)}")
+
+    # Parse table output for key metrics
+    tbl_file = output_path / "eplustbl.htm"
+    if tbl_file.exists():
+        results["summary"]["html_report_available"] = True
+        # Extract key values from HTML (simplified parsing)
+        try:
+            # Search the raw bytes in place; the report can be tens of MB
+            # and only the presence of the table matters here
+            with open(tbl_file, "rb") as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Look for common summary values
+                if mm.find(b"Total Site Energy") != -1:
+                    results["summary"]["has_energy_summary"] = True
+        except Exception:
+            # Includes ValueError from mapping an empty file
+            pass
+
+    return results
+
+
+# Output files read by the results endpoints, besides the *Meter.csv file
+_RESULT_FILES = frozenset({"eplusout.err", "eplusout.end", "eplustbl.htm"})
+
+
+def _output_fingerprint(output_directory: str) -> Tuple:
+    """
+    Cheap fingerprint of an output directory for caching parsed results.
+
+    The directory mtime changes when files are added, removed or renamed;
+    the mtime and size of each parsed file catch in-place rewrites.
+    """
+    entries = []
+    with os.scandir(output_directory) as it:
+        for entry in it:
+            if entry.name in _RESULT_FILES or entry.name.endswith("Meter.csv"):
+                st = entry.stat()
+                entries.append((entry.name, st.st_mtime_ns, st.st_size))
+    return os.stat(output_directory).st_mtime_ns, tuple(sorted(entries))
+
+
+# Time-series payloads can be large, so only a modest number are kept
+@functools.lru_cache(maxsize=32)
+def _cached_simulation_results(output_directory: str, fingerprint: Tuple, include_timeseries: bool) -> Dict[str, Any]:
+    """Parsed results for an output directory; the fingerprint key invalidates stale entries"""
+    return _collect_simulation_results(output_directory, include_timeseries)
+
+
+def _simulation_results(output_directory: str, include_timeseries: bool) -> Dict[str, Any]:
+    """
+    Simulation results for an output directory, cached until its files change.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+    fingerprint = _output_fingerprint(output_directory)
+    return _cached_simulation_results(output_directory, fingerprint, include_timeseries)
+
+
 @app.get("/api/simulation/results")
 async def get_simulation_results(output_directory: str, include_timeseries: bool = False):
     """
@@ -412,6 +884,7 @@ async def get_simulation_results(output_directory: str, include_timeseries: bool
     Args:
         output_directory: Path to the simulation output directory
         include_timeseries: If True, includes parsed CSV time-series data (can be large)
+                            as {"columns": [...], "data": {column: [values]}}
     """
     try:
         output_path = Path(output_directory)
@@ -419,93 +892,89 @@ async def get_simulation_results(output_directory: str, include_timeseries: bool
         if not output_path.exists():
             raise HTTPException(status_code=404, detail=f"Output directory not found: {output_directory}")
 
-        results = {
-            "success": True,
-            "output_directory": output_directory,
-            "files": {},
-            "summary": {},
-            "errors": [],
-            "warnings": []
-        }
-
-        # List all output files
-        for f in output_path.iterdir():
-            if f.is_file():
-                results["files"][f.suffix.lower()] = results["files"].get(f.suffix.lower(), []) + [f.name]
-
-        # Parse error file for warnings/errors
-        err_file = output_path / "eplusout.err"
-        if err_file.exists():
-            with open(err_file, "r", encoding="utf-8", errors="ignore") as f:
-                err_content = f.read()
-                for line in err_content.split("\n"):
-                    if "** Warning **" in line:
-                        results["warnings"].append(line.strip())
-                    elif "** Severe **" in line or "** Fatal **" in line:
-                        results["errors"].append(line.strip())
-
-        # Parse end file for summary
-        end_file = output_path / "eplusout.end"
-        if end_file.exists():
-            with open(end_file, "r", encoding="utf-8", errors="ignore") as f:
-                end_content = f.read()
-                results["summary"]["completion_status"] = end_content.strip()
-
-        # Parse CSV meter data if available
-        meter_csv = None
-        for f in output_path.glob("*Meter.csv"):
-            meter_csv = f
-            break
-
-        if meter_csv and meter_csv.exists():
-            import pandas as pd
-            try:
-                df = pd.read_csv(meter_csv)
-                # Get column names (these are the meter names)
-                results["summary"]["meters"] = list(df.columns[1:])  # Skip Date/Time column
-
-                # Calculate totals for energy meters
-                energy_totals = {}
-                for col in df.columns[1:]:
-                    if "Electricity" in col or "Gas" in col or "Energy" in col:
-                        total = df[col].sum()
-                        energy_totals[col] = {
-                            "total": float(total),
-                            "unit": "J"
-                        }
-                results["summary"]["energy_totals"] = energy_totals
-
-                if include_timeseries:
-                    # Convert to list of dicts for JSON
-                    results["timeseries"] = {
-                        "meter_data": df.to_dict(orient="records")
-                    }
-            except Exception as e:
-                results["warnings"].append(f"Could not parse meter CSV: {str(e)}")
-
-        # Parse table output for key metrics
-        tbl_file = output_path / "eplustbl.htm"
-        if tbl_file.exists():
-            results["summary"]["html_report_available"] = True
-            # Extract key values from HTML (simplified parsing)
-            try:
-                with open(tbl_file, "r", encoding="utf-8", errors="ignore") as f:
-                    html_content = f.read()
-                    # Look for common summary values
-                    if "Total Site Energy" in html_content:
-                        results["summary"]["has_energy_summary"] = True
-            except Exception:
-                pass
-
-        return results
+        results = await asyncio.to_thread(_simulation_results, output_directory, include_timeseries)
+        # Returned as a response directly so ORJSONResponse serializes the
+        # NumPy time-series columns without a jsonable_encoder pass
+        return ORJSONResponse(results)
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting simulation results: {str(e)}")
+        logger.error("Error getting simulation results: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _collect_results_summary(output_directory: str) -> Dict[str, Any]:
+    """Build the condensed results summary for an output directory (blocking)"""
+    output_path = Path(output_directory)
+    summary = {
+        "success": True,
+        "output_directory": output_directory,
+        "simulation_completed": False,
+        "energy_summary": {},
+        "warnings_count": 0,
+        "errors_count": 0,
+        "key_metrics": {}
+    }
+
+    # Check completion
+    end_file = output_path / "eplusout.end"
+    if end_file.exists():
+        with open(end_file, "r", encoding="utf-8", errors="ignore") as f:
+            content = f.read()
+            summary["simulation_completed"] = "Successfully" in content
+
+    # Count warnings/errors
+    err_file = output_path / "eplusout.err"
+    if err_file.exists():
+        summary["warnings_count"], summary["errors_count"] = _count_err_messages(err_file)
+
+    # Parse meter data for energy summary
+    meter_csv = _find_meter_csv(output_path)
+    if meter_csv:
+        try:
+            column_totals = _meter_column_totals(meter_csv)
+
+            # Facility and IT electricity are picked out in the same pass, for PUE
+            facility_elec = None
+            it_elec = None
+            for col, total_j in column_totals.items():
+                summary["energy_summary"][col] = {
+                    "total_J": total_j,
+                    # Convert to more useful units
+                    "total_kWh": total_j / 3600000,  # J to kWh
+                    "total_GJ": total_j / 1e9  # J to GJ
+                }
+                if "Electricity:Facility" in col:
+                    facility_elec = total_j
+                if "ITE" in col or "IT Equipment" in col:
+                    it_elec = total_j
+
+            # Calculate PUE if we have IT and Facility electricity
+            if facility_elec and it_elec and it_elec > 0:
+                summary["key_metrics"]["PUE"] = facility_elec / it_elec
+
+        except Exception as e:
+            summary["parse_error"] = str(e)
+
+    return summary
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_results_summary(output_directory: str, fingerprint: Tuple) -> Dict[str, Any]:
+    """Results summary for an output directory; the fingerprint key invalidates stale entries"""
+    return _collect_results_summary(output_directory)
+
+
+def _results_summary(output_directory: str) -> Dict[str, Any]:
+    """
+    Results summary for an output directory, cached until its files change.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+    return _cached_results_summary(output_directory, _output_fingerprint(output_directory))
+
+
 @app.get("/api/simulation/results/summary")
 async def get_results_summary(output_directory: str):
     """
@@ -519,82 +988,104 @@ async def get_results_summary(output_directory: str):
         if not output_path.exists():
             raise HTTPException(status_code=404, detail=f"Output directory not found: {output_directory}")
 
-        summary = {
-            "success": True,
-            "output_directory": output_directory,
-            "simulation_completed": False,
-            "energy_summary": {},
-            "warnings_count": 0,
-            "errors_count": 0,
-            "key_metrics": {}
-        }
+        return await asyncio.to_thread(_results_summary, output_directory)
 
-        # Check completion
-        end_file = output_path / "eplusout.end"
-        if end_file.exists():
-            with open(end_file, "r", encoding="utf-8", errors="ignore") as f:
-                content = f.read()
-                summary["simulation_completed"] = "Successfully" in content
-
-        # Count warnings/errors
-        err_file = output_path / "eplusout.err"
-        if err_file.exists():
-            with open(err_file, "r", encoding="utf-8", errors="ignore") as f:
-                content = f.read()
-                summary["warnings_count"] = content.count("** Warning **")
-                summary["errors_count"] = content.count("** Severe **") + content.count("** Fatal **")
-
-        # Parse meter data for energy summary
-        for meter_csv in output_path.glob("*Meter.csv"):
-            import pandas as pd
-            try:
-                df = pd.read_csv(meter_csv)
-
-                for col in df.columns[1:]:
-                    total_j = df[col].sum()
-                    # Convert to more useful units
-                    total_kwh = total_j / 3600000  # J to kWh
-                    total_gj = total_j / 1e9  # J to GJ
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Error getting results summary: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
 
-                    summary["energy_summary"][col] = {
-                        "total_J": float(total_j),
-                        "total_kWh": float(total_kwh),
-                        "total_GJ": float(total_gj)
-                    }
 
-                # Calculate PUE if we have IT and Facility electricity
-                facility_elec = None
-                it_elec = None
-                for col in df.columns:
-                    if "Electricity:Facility" in col:
-                        facility_elec = df[col].sum()
-                    if "ITE" in col or "IT Equipment" in col:
-                        it_elec = df[col].sum()
+def _read_head(path: Path, max_lines: int, count_lines: bool) -> Tuple[List[str], Optional[int], bool]:
+    """
+    Read the first max_lines lines of a text output file (blocking).
 
-                if facility_elec and it_elec and it_elec > 0:
-                    summary["key_metrics"]["PUE"] = float(facility_elec / it_elec)
+    Only the requested lines are kept in memory. The rest of the file is
+    scanned only when count_lines is set.
 
-            except Exception as e:
-                summary["parse_error"] = str(e)
-            break
+    Returns:
+        Tuple of (lines, total line count or None if not counted, truncated)
+    """
+    lines = []
+    truncated = False
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        for line in f:
+            if len(lines) == max_lines:
+                truncated = True
+                break
+            lines.append(line)
 
-        return summary
+        if not truncated:
+            return lines, len(lines), False
+        if count_lines:
+            # The line that triggered truncation was consumed above
+            return lines, max_lines + 1 + sum(1 for _ in f), True
+    return lines, None, True
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error getting results summary: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+
+# Above this many lines /api/files/read streams its response body
+_STREAM_MIN_LINES = 500
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _stream_file_json(f, header: Dict[str, Any], max_lines: int, count_lines: bool) -> Iterator[bytes]:
+    """
+    Yield the /api/files/read JSON body for an open text file, then close it.
+
+    The content string is written in chunks as lines are read, so the
+    lines are never joined into one large string. total_lines and truncated
+    are only known once reading stops, so they follow the content.
+    """
+    try:
+        # Header fields, then the opening quote of the content string
+        yield orjson.dumps(header)[:-1] + b',"content":"'
+
+        chunk = []
+        chunk_size = 0
+        count = 0
+        truncated = False
+        for line in f:
+            if count == max_lines:
+                truncated = True
+                break
+            # JSON-escaped line without its surrounding quotes
+            encoded = orjson.dumps(line)[1:-1]
+            chunk.append(encoded)
+            chunk_size += len(encoded)
+            count += 1
+            if chunk_size >= _STREAM_CHUNK_SIZE:
+                yield b"".join(chunk)
+                chunk = []
+                chunk_size = 0
+        if chunk:
+            yield b"".join(chunk)
+
+        if not truncated:
+            total_lines = count
+        elif count_lines:
+            # The line that triggered truncation was consumed above
+            total_lines = count + 1 + sum(1 for _ in f)
+        else:
+            total_lines = None
+        yield b'",' + orjson.dumps({"total_lines": total_lines, "truncated": truncated})[1:]
+    finally:
+        f.close()
 
 
 @app.get("/api/files/read")
-async def read_output_file(file_path: str, max_lines: int = 1000):
+async def read_output_file(file_path: str, max_lines: int = 1000, count_lines: bool = False):
     """
     Read contents of an output file.
 
     Args:
         file_path: Full path to the file to read
         max_lines: Maximum number of lines to return (default 1000)
+        count_lines: If True, scan the whole file so total_lines is reported
+                     for truncated files (otherwise it is null when truncated)
+
+    Requests for more than 500 lines are streamed; the JSON fields are the
+    same, with content sent before total_lines and truncated.
     """
     try:
         path = Path(file_path)
@@ -603,16 +1094,24 @@ async def read_output_file(file_path: str, max_lines: int = 1000):
             raise HTTPException(status_code=404, detail=f"File not found: {file_path}")
 
         # Security: only allow reading from outputs directory
-        outputs_dir = Path(config.paths.output_dir).resolve()
-        if not str(path.resolve()).startswith(str(outputs_dir)):
+        if not _in_outputs_dir(path):
             raise HTTPException(status_code=403, detail="Access denied: can only read files from outputs directory")
 
-        # Read file
-        with open(path, "r", encoding="utf-8", errors="ignore") as f:
-            lines = f.readlines()
+        max_lines = max(max_lines, 0)
+        if max_lines > _STREAM_MIN_LINES:
+            # Open here so a failure is still reported as an HTTP error;
+            # StreamingResponse iterates the generator in a worker thread
+            f = await asyncio.to_thread(open, path, "r", encoding="utf-8", errors="ignore")
+            header = {"success": True, "file_path": file_path, "file_name": path.name}
+            return StreamingResponse(
+                _stream_file_json(f, header, max_lines, count_lines),
+                media_type="application/json"
+            )
 
-        total_lines = len(lines)
-        truncated = total_lines > max_lines
+        # Read file
+        lines, total_lines, truncated = await asyncio.to_thread(
+            _read_head, path, max_lines, count_lines
+        )
 
         return {
             "success": True,
@@ -620,13 +1119,13 @@ async def read_output_file(file_path: str, max_lines: int = 1000):
             "file_name": path.name,
             "total_lines": total_lines,
             "truncated": truncated,
-            "content": "".join(lines[:max_lines])
+            "content": "".join(lines)
         }
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error reading file: {str(e)}")
+        logger.error("Error reading file: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -647,47 +1146,57 @@ async def download_file(file_path: str):
     try:
         path = Path(file_path)
 
-        if not path.exists():
+        # The stat result is handed to FileResponse so it does not stat again
+        try:
+            stat_result = path.stat()
+        except FileNotFoundError:
             raise HTTPException(status_code=404, detail=f"File not found: {file_path}")
 
         # Security: only allow downloading from outputs directory
-        outputs_dir = Path(config.paths.output_dir).resolve()
-        if not str(path.resolve()).startswith(str(outputs_dir)):
+        if not _in_outputs_dir(path):
             raise HTTPException(status_code=403, detail="Access denied: can only download files from outputs directory")
 
         # Determine media type based on extension
-        media_types = {
-            ".csv": "text/csv",
-            ".html": "text/html",
-            ".htm": "text/html",
-            ".json": "application/json",
-            ".idf": "text/plain",
-            ".epw": "text/plain",
-            ".sql": "application/x-sqlite3",
-            ".obj": "model/obj",
-            ".mtl": "text/plain",
-            ".glb": "model/gltf-binary",
-            ".gltf": "model/gltf+json",
-            ".txt": "text/plain",
-            ".err": "text/plain",
-            ".eso": "text/plain",
-            ".eio": "text/plain",
+        media_type = _MEDIA_TYPES.get(path.suffix.lower(), "application/octet-stream")
+
+        # Output files are rewritten in place by new runs, so clients must
+        # revalidate; the ETag lets them do that cheaply
+        headers = {
+            "Cache-Control": "no-cache",
+            "ETag": f'"{stat_result.st_mtime_ns}-{stat_result.st_size}"'
         }
-        media_type = media_types.get(path.suffix.lower(), "application/octet-stream")
 
         return FileResponse(
             path=str(path),
             filename=path.name,
-            media_type=media_type
+            media_type=media_type,
+            stat_result=stat_result,
+            headers=headers
         )
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error downloading file: {str(e)}")
+        logger.error("Error downloading file: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _list_files(path: Path) -> List[Dict[str, Any]]:
+    """Describe the regular files in a directory (blocking)"""
+    files = []
+    # DirEntry caches its type and stat, unlike the Path methods
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_file():
+                files.append({
+                    "name": entry.name,
+                    "path": entry.path,
+                    "size_bytes": entry.stat().st_size,
+                    "extension": os.path.splitext(entry.name)[1].lower()
+                })
+    return files
+
+
 @app.get("/api/files/list")
 async def list_output_files(folder_path: str):
     """
@@ -709,19 +1218,10 @@ async def list_output_files(folder_path: str):
             raise HTTPException(status_code=400, detail=f"Path is not a directory: {folder_path}")
 
         # Security: only allow listing from outputs directory
-        outputs_dir = Path(config.paths.output_dir).resolve()
-        if not str(path.resolve()).startswith(str(outputs_dir)):
+        if not _in_outputs_dir(path):
             raise HTTPException(status_code=403, detail="Access denied: can only list files from outputs directory")
 
-        files = []
-        for file in path.iterdir():
-            if file.is_file():
-                files.append({
-                    "name": file.name,
-                    "path": str(file),
-                    "size_bytes": file.stat().st_size,
-                    "extension": file.suffix.lower()
-                })
+        files = await asyncio.to_thread(_list_files, path)
 
         return {
             "success": True,
@@ -734,7 +1234,7 @@ async def list_output_files(folder_path: str):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error listing files: {str(e)}")
+        logger.error("Error listing files: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -743,7 +1243,7 @@ async def list_output_files(folder_path: str):
 # =============================================================================
 
 @app.get("/api/models/info")
-async def get_model_info(idf_path: str):
+async def get_model_info(idf_path: str, ep_manager: EnergyPlusManager = Depends(get_ep_manager)):
     """Get basic information about an IDF model"""
     try:
         result = ep_manager.load_idf(idf_path)
@@ -755,11 +1255,11 @@ async def get_model_info(idf_path: str):
 
 
 @app.get("/api/models/zones")
-async def list_model_zones(idf_path: str):
+async def list_model_zones(idf_path: str, ep_manager: EnergyPlusManager = Depends(get_ep_manager)):
     """List all zones in an IDF model"""
     try:
         result = ep_manager.list_zones(idf_path)
-        return json.loads(result)
+        return orjson.loads(result)
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -767,11 +1267,11 @@ async def list_model_zones(idf_path: str):
 
 
 @app.get("/api/models/validate")
-async def validate_model(idf_path: str):
+async def validate_model(idf_path: str, ep_manager: EnergyPlusManager = Depends(get_ep_manager)):
     """Validate an IDF model"""
     try:
         result = ep_manager.validate_idf(idf_path)
-        return json.loads(result)
+        return orjson.loads(result)
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -785,12 +1285,13 @@ async def validate_model(idf_path: str):
 @app.get("/api/files/available")
 async def list_available_files(
     include_example_files: bool = False,
-    include_weather_data: bool = False
+    include_weather_data: bool = False,
+    ep_manager: EnergyPlusManager = Depends(get_ep_manager)
 ):
     """List available sample files, examples, and weather data"""
     try:
         result = ep_manager.list_available_files(include_example_files, include_weather_data)
-        return json.loads(result)
+        return orjson.loads(result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -825,9 +1326,12 @@ async def export_to_gdrive(request: GDriveExportRequest):
         files_failed: int - Number of files that failed to upload
     """
     try:
-        gdrive_service = GDriveService()
+        gdrive_service = _get_gdrive_service()
 
-        result = gdrive_service.upload_folder(
+        # Uploads are blocking network calls; run them in a worker thread so
+        # other requests are served meanwhile
+        result = await asyncio.to_thread(
+            gdrive_service.upload_folder,
             source_folder=request.source_folder,
             destination_folder_url_or_id=request.destination_folder
         )
@@ -835,10 +1339,10 @@ async def export_to_gdrive(request: GDriveExportRequest):
         return result
 
     except GDriveServiceError as e:
-        logger.error(f"Google Drive export error: {str(e)}")
+        logger.error("Google Drive export error: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error(f"Unexpected error during Google Drive export: {str(e)}")
+        logger.error("Unexpected error during Google Drive export: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -873,9 +1377,10 @@ async def export_to_supabase(request: SupabaseExportRequest):
         - total_size_bytes: int - Total size of uploaded files
     """
     try:
-        supabase_service = SupabaseStorageService()
+        supabase_service = _get_supabase_service()
 
-        result = supabase_service.upload_folder(
+        # Uploads run off the event loop, so other requests are served meanwhile
+        result = await supabase_service.upload_folder_async(
             source_folder=request.source_folder,
             destination_folder=request.destination_folder,
             replace_existing=True
@@ -884,10 +1389,10 @@ async def export_to_supabase(request: SupabaseExportRequest):
         return result
 
     except SupabaseServiceError as e:
-        logger.error(f"Supabase export error: {str(e)}")
+        logger.error("Supabase export error: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error(f"Unexpected error during Supabase export: {str(e)}")
+        logger.error("Unexpected error during Supabase export: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -895,7 +1400,7 @@ async def export_to_supabase(request: SupabaseExportRequest):
 # 3D Geometry Export Endpoints
 # =============================================================================
 
-class GeometryExportRequest(BaseModel):
+class GeometryExportRequest(RequestModel):
     """Request model for 3D geometry export"""
     idf_path: str = Field(..., description="Path to the IDF file to export")
     output_dir: Optional[str] = Field(None, description="Output directory (default: same as IDF)")
@@ -904,6 +1409,10 @@ class GeometryExportRequest(BaseModel):
         default=["glb"],
         description="Output formats: 'obj', 'glb', 'gltf'. Default: ['glb']"
     )
+    compress: Literal["none", "quantize", "meshopt"] = Field(
+        "none",
+        description="'quantize' stores .glb vertex data as 16-bit integers; 'meshopt' also compresses it (needs gltfpack)"
+    )
 
 
 @app.post("/api/export/3d")
@@ -935,20 +1444,24 @@ async def export_3d_geometry(request: GeometryExportRequest):
     try:
         geometry_service = GeometryExportService()
 
-        result = geometry_service.export(
+        # IDF parsing and mesh conversion are blocking; run them in a worker
+        # thread so other requests are served meanwhile
+        result = await asyncio.to_thread(
+            geometry_service.export,
             idf_path=request.idf_path,
             output_dir=request.output_dir,
             output_name=request.output_name,
-            formats=request.formats
+            formats=request.formats,
+            compress=request.compress
         )
 
         return result
 
     except GeometryExportError as e:
-        logger.error(f"3D geometry export error: {str(e)}")
+        logger.error("3D geometry export error: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error(f"Unexpected error during 3D export: {str(e)}")
+        logger.error("Unexpected error during 3D export: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -971,13 +1484,13 @@ async def get_geometry_info(idf_path: str):
     """
     try:
         geometry_service = GeometryExportService()
-        return geometry_service.get_geometry_info(idf_path)
+        return await asyncio.to_thread(geometry_service.get_geometry_info, idf_path)
 
     except GeometryExportError as e:
-        logger.error(f"Geometry info error: {str(e)}")
+        logger.error("Geometry info error: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error(f"Unexpected error getting geometry info: {str(e)}")
+        logger.error("Unexpected error getting geometry info: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -988,8 +1501,10 @@ async def get_geometry_info(idf_path: str):
 if __name__ == "__main__":
     import uvicorn
 
-    logger.info(f"Starting EnergyPlus HTTP API v{config.server.version}")
-    logger.info(f"EnergyPlus version: {config.energyplus.version}")
+    config = get_config()
+
+    logger.info("Starting EnergyPlus HTTP API v%s", config.server.version)
+    logger.info("EnergyPlus version: %s", config.energyplus.version)
     logger.info("API docs available at http://localhost:8000/docs")
 
     uvicorn.run(
@@ -23,6 +23,7 @@ from mcp.server.fastmcp import FastMCP
 # Import our EnergyPlus utilities and configuration
 from energyplus_mcp_server.energyplus_tools import EnergyPlusManager
 from energyplus_mcp_server.config import get_config, Config
+from energyplus_mcp_server._paths import BUILDING_SCHEMA_PATH
 from energyplus_mcp_server.utils.weather_lookup import WeatherLookup, WeatherLookupError
 from energyplus_mcp_server.utils.template_service import TemplateService, TemplateServiceError
 
@@ -1699,15 +1700,13 @@ async def get_building_specification_schema() -> str:
         JSON string containing the building specification schema
     """
     try:
-        schema_path = Path(__file__).parent.parent / "schemas" / "building_specification.json"
-
-        if not schema_path.exists():
+        if not os.path.isfile(BUILDING_SCHEMA_PATH):
             return json.dumps({
                 "success": False,
                 "error": "Building specification schema not found"
             }, indent=2)
 
-        with open(schema_path, "r", encoding="utf-8") as f:
+        with open(BUILDING_SCHEMA_PATH, "r", encoding="utf-8") as f:
             schema = json.load(f)
 
         return json.dumps({
@@ -17,11 +17,50 @@ Usage:
 
 import os
 import logging
+import functools
+import mimetypes
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 
 logger = logging.getLogger(__name__)
 
+# Concurrent uploads per folder; well under Drive's per-user request quota
+DEFAULT_UPLOAD_WORKERS = 8
+
+# Retries (with exponential backoff) for rate-limited or 5xx API calls
+API_NUM_RETRIES = 3
+
+# Socket timeout in seconds for Drive API connections
+HTTP_TIMEOUT_SECONDS = 120
+
+# Files above this size use a resumable upload session; smaller files are
+# sent in a single multipart request (one round trip instead of two)
+RESUMABLE_THRESHOLD_BYTES = 5 * 1024 * 1024
+
+# MIME types for EnergyPlus outputs, by lowercase extension; other files
+# fall back to the mimetypes module
+_MIME_TYPES = {
+    ".csv": "text/csv",
+    ".htm": "text/html",
+    ".html": "text/html",
+    ".idf": "text/plain",
+    ".epw": "text/plain",
+    ".err": "text/plain",
+    ".eso": "text/plain",
+    ".eio": "text/plain",
+    ".end": "text/plain",
+    ".mtd": "text/plain",
+    ".mtr": "text/plain",
+    ".rdd": "text/plain",
+    ".mdd": "text/plain",
+    ".shd": "text/plain",
+    ".sql": "application/x-sqlite3",
+    ".json": "application/json",
+    ".txt": "text/plain",
+}
+
 # Google Drive folder URL pattern
 # https://drive.google.com/drive/folders/FOLDER_ID
 # or https://drive.google.com/drive/u/0/folders/FOLDER_ID
@@ -32,6 +71,69 @@ class GDriveServiceError(Exception):
     pass
 
 
+_DRIVE_SCOPES = ["https://www.googleapis.com/auth/drive"]
+
+
+@functools.lru_cache(maxsize=4)
+def _load_credentials(credentials_path: str, mtime_ns: int):
+    """
+    Load service account credentials, shared process-wide.
+
+    Sharing one Credentials object also shares its access token, so the
+    OAuth exchange happens once rather than per service instance. The
+    mtime key reloads the credentials when the file is replaced.
+    """
+    from google.oauth2.service_account import Credentials
+    return Credentials.from_service_account_file(credentials_path, scopes=_DRIVE_SCOPES)
+
+
+# The calling thread's Drive client and the key it was built for, keyed like
+# _load_credentials. The client's httplib2 transport is not thread-safe, so
+# threads never share one; a thread keeps only its latest client
+_thread_clients = threading.local()
+
+
+def _get_drive_client(credentials_path: str):
+    """Get or build the calling thread's Drive client for a credentials file"""
+    key = (credentials_path, os.stat(credentials_path).st_mtime_ns)
+    cached = getattr(_thread_clients, "client", None)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    import httplib2
+    from google_auth_httplib2 import AuthorizedHttp
+    from googleapiclient.discovery import build
+    # One persistent httplib2.Http per thread keeps its TLS connection to
+    # the Drive API open between calls
+    authed_http = AuthorizedHttp(
+        _load_credentials(*key),
+        http=httplib2.Http(timeout=HTTP_TIMEOUT_SECONDS)
+    )
+    # The Drive discovery document ships with the library (static_discovery)
+    client = build(
+        "drive", "v3",
+        http=authed_http,
+        cache_discovery=False,
+        static_discovery=True
+    )
+    _thread_clients.client = (key, client)
+    if cached is not None:
+        # Built for a replaced credentials file; release its connection
+        cached[1].close()
+    return client
+
+
+@functools.lru_cache(maxsize=4)
+def _get_upload_executor(max_workers: int) -> ThreadPoolExecutor:
+    """
+    Long-lived upload thread pool, shared by all folder uploads.
+
+    Worker threads outlive a single upload_folder call, so their Drive
+    clients and open connections are reused by the next one.
+    """
+    return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="gdrive-upload")
+
+
 class GDriveService:
     """Service for uploading files/folders to Google Drive"""
 
@@ -44,16 +146,17 @@ class GDriveService:
                             If not provided, uses GOOGLE_DRIVE_CREDENTIALS env var.
         """
         self.credentials_path = credentials_path or os.environ.get("GOOGLE_DRIVE_CREDENTIALS", "")
-        self._service = None
 
     def _get_service(self):
-        """Get or create the Google Drive service client."""
-        if self._service is not None:
-            return self._service
+        """
+        Get the Google Drive service client for the calling thread.
 
+        Credentials and clients are cached at module level, so new
+        GDriveService instances reuse them.
+        """
         try:
-            from google.oauth2.service_account import Credentials
-            from googleapiclient.discovery import build
+            import google.oauth2.service_account  # noqa: F401
+            import googleapiclient.discovery  # noqa: F401
         except ImportError:
             raise GDriveServiceError(
                 "Google Drive dependencies not installed. "
@@ -67,10 +170,7 @@ class GDriveService:
             )
 
         try:
-            scopes = ["https://www.googleapis.com/auth/drive"]
-            creds = Credentials.from_service_account_file(self.credentials_path, scopes=scopes)
-            self._service = build("drive", "v3", credentials=creds)
-            return self._service
+            return _get_drive_client(self.credentials_path)
         except Exception as e:
             raise GDriveServiceError(f"Failed to initialize Google Drive service: {str(e)}")
 
@@ -128,7 +228,7 @@ class GDriveService:
             folder = service.files().create(
                 body=file_metadata,
                 fields="id, name, webViewLink"
-            ).execute()
+            ).execute(num_retries=API_NUM_RETRIES)
 
             logger.info(f"Created folder: {folder_name} (ID: {folder['id']})")
             return folder
@@ -136,13 +236,19 @@ class GDriveService:
         except Exception as e:
             raise GDriveServiceError(f"Failed to create folder '{folder_name}': {str(e)}")
 
-    def upload_file(self, file_path: Path, parent_folder_id: str) -> Dict[str, Any]:
+    def upload_file(
+        self,
+        file_path: Path,
+        parent_folder_id: str,
+        file_size: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
         Upload a single file to Google Drive.
 
         Args:
             file_path: Path to the file to upload
             parent_folder_id: ID of the destination folder
+            file_size: Size of the file in bytes, if already known
 
         Returns:
             Dict with file info including 'id' and 'name'
@@ -157,36 +263,29 @@ class GDriveService:
         }
 
         # Determine MIME type based on extension
-        mime_types = {
-            ".csv": "text/csv",
-            ".htm": "text/html",
-            ".html": "text/html",
-            ".idf": "text/plain",
-            ".epw": "text/plain",
-            ".err": "text/plain",
-            ".eso": "text/plain",
-            ".eio": "text/plain",
-            ".end": "text/plain",
-            ".mtd": "text/plain",
-            ".mtr": "text/plain",
-            ".rdd": "text/plain",
-            ".mdd": "text/plain",
-            ".shd": "text/plain",
-            ".sql": "application/x-sqlite3",
-            ".json": "application/json",
-            ".txt": "text/plain",
-        }
-
-        mime_type = mime_types.get(file_path.suffix.lower(), "application/octet-stream")
+        mime_type = (
+            _MIME_TYPES.get(file_path.suffix.lower())
+            or mimetypes.guess_type(file_path.name)[0]
+            or "application/octet-stream"
+        )
 
         try:
-            media = MediaFileUpload(str(file_path), mimetype=mime_type, resumable=True)
+            if file_size is None:
+                file_size = file_path.stat().st_size
+
+            if file_size > RESUMABLE_THRESHOLD_BYTES:
+                # chunksize=-1 sends the media in one PUT rather than 100 KB chunks.
+                # The whole body is then held for the request (and any retry);
+                # EnergyPlus outputs stay well under 100 MB, so that is acceptable
+                media = MediaFileUpload(str(file_path), mimetype=mime_type, chunksize=-1, resumable=True)
+            else:
+                media = MediaFileUpload(str(file_path), mimetype=mime_type, resumable=False)
 
             file = service.files().create(
                 body=file_metadata,
                 media_body=media,
                 fields="id, name, size"
-            ).execute()
+            ).execute(num_retries=API_NUM_RETRIES)
 
             logger.debug(f"Uploaded file: {file_path.name}")
             return file
@@ -198,15 +297,20 @@ class GDriveService:
         self,
         source_folder: str,
         destination_folder_url_or_id: str,
-        folder_name: Optional[str] = None
+        folder_name: Optional[str] = None,
+        max_workers: int = DEFAULT_UPLOAD_WORKERS
     ) -> Dict[str, Any]:
         """
         Upload an entire folder to Google Drive.
 
+        Files are uploaded concurrently, so the time taken is not the sum of
+        the per-file round trips.
+
         Args:
             source_folder: Path to the local folder to upload
             destination_folder_url_or_id: Google Drive folder URL or ID
             folder_name: Optional name for the new folder (defaults to source folder name)
+            max_workers: Maximum number of concurrent file uploads
 
         Returns:
             Dict with upload results including:
@@ -249,18 +353,29 @@ class GDriveService:
             result["folder_id"] = new_folder["id"]
             result["folder_url"] = new_folder.get("webViewLink", f"https://drive.google.com/drive/folders/{new_folder['id']}")
 
-            # Upload all files in the source folder
-            files = list(source_path.iterdir())
-            for file_path in files:
-                if file_path.is_file():
-                    try:
-                        uploaded = self.upload_file(file_path, new_folder["id"])
-                        result["files_uploaded"] += 1
-                        result["total_size_bytes"] += file_path.stat().st_size
-                    except Exception as e:
-                        logger.error(f"Failed to upload {file_path.name}: {e}")
-                        result["files_failed"] += 1
-                        result["failed_files"].append(file_path.name)
+            # Upload all files in the source folder. Each worker thread gets
+            # its own Drive client (see _get_service)
+            # Files are submitted while the directory is scanned; DirEntry
+            # caches its type and stat, so each file is stat-ed once
+            executor = _get_upload_executor(max(1, max_workers))
+            futures = {}
+            with os.scandir(source_path) as it:
+                for entry in it:
+                    if entry.is_file():
+                        file_path = Path(entry.path)
+                        file_size = entry.stat().st_size
+                        future = executor.submit(self.upload_file, file_path, new_folder["id"], file_size)
+                        futures[future] = (file_path, file_size)
+            for future in as_completed(futures):
+                file_path, file_size = futures[future]
+                try:
+                    future.result()
+                    result["files_uploaded"] += 1
+                    result["total_size_bytes"] += file_size
+                except Exception as e:
+                    logger.error(f"Failed to upload {file_path.name}: {e}")
+                    result["files_failed"] += 1
+                    result["failed_files"].append(file_path.name)
 
             # Mark as successful if we uploaded at least one file and had no failures
             result["copy_successful"] = result["files_uploaded"] > 0 and result["files_failed"] == 0
@@ -5,7 +5,8 @@ Exports IDF building geometry to 3D formats (OBJ, glTF) for visualization
 in Blender, web viewers, and other 3D applications.
 
 Pipeline:
-    IDF → GeomEppy (OBJ export) → Trimesh (glTF conversion) → Output files
+    IDF → GeomEppy (OBJ export) → Output files
+    IDF → surface polygons → Trimesh (glTF conversion) → Output files
 
 Supported output formats:
     - OBJ (.obj + .mtl) - Wavefront, widely supported
@@ -35,22 +36,219 @@ if not hasattr(collections, 'Sequence'):
 if not hasattr(collections, 'Iterable'):
     collections.Iterable = collections.abc.Iterable
 
+import functools
+import hashlib
 import logging
+import os
+import shutil
+import subprocess
 import tempfile
+import threading
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Literal
+from typing import Optional, Dict, Any, List, Literal, Tuple
 
 logger = logging.getLogger(__name__)
 
 # Output format types
 OutputFormat = Literal["obj", "glb", "gltf"]
 
+# glTF binary compression, applied to .glb output with gltfpack when it is
+# on PATH: "quantize" stores vertex attributes as 16-bit integers
+# (KHR_mesh_quantization); "meshopt" also compresses them
+# (EXT_meshopt_compression)
+Compression = Literal["none", "quantize", "meshopt"]
+
+# gltfpack arguments per compression mode; gltfpack quantizes by default
+_GLTFPACK_FLAGS = {
+    "quantize": [],
+    "meshopt": ["-cc"],
+}
+
+# Finished .glb files are cached by a hash of the IDF content, the export
+# options and the mesh builder, in MCP_GEOMETRY_CACHE_DIR or else a
+# subdirectory of the configured temp directory. The least recently used
+# files are removed once the cache grows past this many bytes
+GLB_CACHE_MAX_BYTES = int(os.environ.get("MCP_GEOMETRY_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+
+# Part of the .glb cache key; bump it whenever a change to the mesh pipeline
+# alters the exported geometry, so files built by older code are not served
+_MESH_BUILDER_VERSION = 2
+
+
+# geomeppy's ObjWriter keeps its faces and vertices in class attributes,
+# shared by every to_obj call in the process; this serializes the calls
+_OBJ_WRITER_LOCK = threading.Lock()
+
 
 class GeometryExportError(Exception):
     """Custom exception for geometry export errors"""
     pass
 
 
+@functools.lru_cache(maxsize=8)
+def _load_idf_cached(path: str, mtime_ns: int):
+    """Parsed IDF; the mtime key invalidates the entry when the file changes"""
+    from geomeppy import IDF
+    return IDF(path)
+
+
+def _glb_cache_dir() -> Path:
+    """Directory of the .glb export cache"""
+    override = os.environ.get("MCP_GEOMETRY_CACHE_DIR")
+    if override:
+        return Path(override)
+    try:
+        from energyplus_mcp_server.config import get_config
+        temp_dir = get_config().paths.temp_dir
+    except Exception:
+        temp_dir = tempfile.gettempdir()
+    return Path(temp_dir) / "energyplus_mcp_geometry_cache"
+
+
+@functools.lru_cache(maxsize=1)
+def _glb_cache_tag() -> bytes:
+    """Mesh builder version and geometry library versions, for the cache key"""
+    from importlib.metadata import version
+    import trimesh
+    return repr((_MESH_BUILDER_VERSION, version("geomeppy"), trimesh.__version__)).encode()
+
+
+def _prune_glb_cache(cache_dir: Path, max_bytes: int) -> None:
+    """Remove the least recently used .glb files until the cache fits max_bytes"""
+    entries = []
+    total = 0
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            if entry.name.endswith(".glb"):
+                st = entry.stat()
+                entries.append((st.st_mtime_ns, st.st_size, entry.path))
+                total += st.st_size
+    if total <= max_bytes:
+        return
+
+    # Cache hits refresh the mtime, so the oldest mtime is the least recently used
+    entries.sort()
+    for _, size, path in entries:
+        if total <= max_bytes:
+            break
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+
+
+@functools.lru_cache(maxsize=1)
+def _surface_materials() -> Dict[str, Dict[str, Any]]:
+    """
+    SimpleMaterial arguments per surface type, from geomeppy's default.mtl.
+
+    These are the materials the OBJ route gets from the .mtl that to_obj
+    writes next to the .obj; the returned dict must not be mutated.
+    """
+    from geomeppy.io.obj import THIS_DIR
+    from trimesh.exchange.obj import parse_mtl
+
+    with open(os.path.join(THIS_DIR, "default.mtl"), "r") as f:
+        return parse_mtl(f.read())
+
+
+def _convex_mask(points, sizes, offsets):
+    """
+    Which of a batch of planar polygons are convex.
+
+    The polygons are stacked in ``points``, polygon i being the ``sizes[i]``
+    rows from ``offsets[i]``. A polygon is convex when every turn along it
+    bends the same way as its (Newell) normal, allowing for collinear
+    vertices, and its exterior angles add up to one full turn, which rules
+    out self-intersecting stars.
+    """
+    import numpy as np
+
+    polygon_ids = np.repeat(np.arange(len(sizes)), sizes)
+    local = np.arange(len(points)) - offsets[polygon_ids]
+    following = offsets[polygon_ids] + (local + 1) % sizes[polygon_ids]
+    after = offsets[polygon_ids] + (local + 2) % sizes[polygon_ids]
+
+    normals = np.add.reduceat(np.cross(points, points[following]), offsets)
+    normal_lengths = np.linalg.norm(normals, axis=1)
+    unit_normals = normals / np.where(normal_lengths > 0, normal_lengths, 1)[:, None]
+
+    edges = points[following] - points
+    next_edges = points[after] - points[following]
+    turns = np.einsum("ij,ij->i", np.cross(edges, next_edges), unit_normals[polygon_ids])
+    scale = np.linalg.norm(edges, axis=1) * np.linalg.norm(next_edges, axis=1)
+    exterior_angles = np.arctan2(turns, np.einsum("ij,ij->i", edges, next_edges))
+
+    same_way = np.minimum.reduceat(turns + 1e-9 * scale, offsets) >= 0
+    one_turn = np.abs(np.add.reduceat(exterior_angles, offsets) - 2 * np.pi) < 1e-6
+    return same_way & one_turn & (normal_lengths > 0)
+
+
+def _fan_triangles(sizes, offsets):
+    """
+    Fan triangulation of stacked convex polygons, as (T, 3) vertex indices.
+
+    Polygon i (``sizes[i]`` vertices from ``offsets[i]``) becomes
+    (start, start + k, start + k + 1) for k in 1..n-2; all triangles are
+    built at once from the per-polygon sizes.
+    """
+    import numpy as np
+
+    tri_counts = sizes - 2
+    tri_offsets = np.cumsum(tri_counts) - tri_counts
+    starts = np.repeat(offsets, tri_counts)
+    k = np.arange(int(tri_counts.sum())) - np.repeat(tri_offsets, tri_counts) + 1
+    return np.column_stack((starts, starts + k, starts + k + 1))
+
+
+def _triangulate(polygon):
+    """
+    Triangles covering a planar polygon, as (n - 2, 3) vertex indices.
+
+    Uses pypoly2tri's constrained Delaunay triangulation in the polygon's
+    plane, as geomeppy does for to_obj, so concave polygons are covered
+    exactly. No vertices are added.
+    """
+    import numpy as np
+
+    if len(polygon) == 3:
+        return np.array([[0, 1, 2]])
+
+    import pypoly2tri as p2t
+    from geomeppy.geom.polygons import Polygon3D
+
+    points = [
+        p2t.shapes.Point(x, y) for x, y in Polygon3D(polygon).project_to_2D().vertices
+    ]
+    index = {id(point): i for i, point in enumerate(points)}
+    cdt = p2t.cdt.CDT(points)
+    cdt.Triangulate()
+    return np.array([
+        [index[id(point)] for point in triangle.points_]
+        for triangle in cdt.GetTriangles()
+    ])
+
+
+class _SurfaceFaces:
+    """
+    Stand-in for geomeppy's ObjWriter that keeps faces instead of writing them.
+
+    Faces are grouped by lowercase surface type, which is how to_obj names
+    the material of each face.
+    """
+
+    def __init__(self):
+        self.by_material: Dict[str, List[list]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(polygons) for polygons in self.by_material.values())
+
+    def add_face(self, coords, mtl: str, test: bool = True):
+        """Record one polygon; test is accepted for ObjWriter compatibility"""
+        self.by_material.setdefault(mtl.lower(), []).append(list(coords))
+
+
 class GeometryExportService:
     """Service for exporting IDF geometry to 3D formats"""
 
@@ -99,6 +297,16 @@ class GeometryExportService:
         self._idd_set = True
         logger.info(f"GeomEppy IDD set to: {self.idd_path}")
 
+    def _load_idf(self, idf_path: Path):
+        """
+        Parse an IDF through a process-wide cache keyed by (path, mtime).
+
+        The returned IDF is shared between callers and must not be modified;
+        use copy.deepcopy on it when a mutable copy is needed.
+        """
+        self._ensure_idd()
+        return _load_idf_cached(str(idf_path), idf_path.stat().st_mtime_ns)
+
     def export_to_obj(
         self,
         idf_path: str,
@@ -120,31 +328,46 @@ class GeometryExportService:
                 - mtl_path: Path to .mtl file
                 - message: Status message
         """
-        self._ensure_idd()
+        idf_path = Path(idf_path)
 
-        from geomeppy import IDF
+        # Determine output paths
+        output_dir = Path(output_dir) if output_dir else idf_path.parent
+        output_name = output_name or idf_path.stem
 
-        idf_path = Path(idf_path)
+        obj_path = self._write_obj(idf_path, output_dir, output_name)
+        mtl_path = obj_path.with_suffix(".mtl")
+
+        result = {
+            "success": True,
+            "obj_path": str(obj_path),
+            "mtl_path": str(mtl_path) if mtl_path.exists() else None,
+            "message": f"Successfully exported to {obj_path}"
+        }
+
+        logger.info(f"OBJ export complete: {obj_path}")
+        return result
+
+    def _write_obj(self, idf_path: Path, output_dir: Path, output_name: str) -> Path:
+        """Parse the IDF and write its geometry to <output_dir>/<output_name>.obj"""
         if not idf_path.exists():
             raise GeometryExportError(f"IDF file not found: {idf_path}")
 
-        # Determine output paths
-        output_dir = Path(output_dir) if output_dir else idf_path.parent
         output_dir.mkdir(parents=True, exist_ok=True)
-
-        output_name = output_name or idf_path.stem
         obj_path = output_dir / f"{output_name}.obj"
-        mtl_path = output_dir / f"{output_name}.mtl"
 
         try:
             # Load IDF and export to OBJ
             logger.info(f"Loading IDF: {idf_path}")
-            idf = IDF(str(idf_path))
+            idf = self._load_idf(idf_path)
 
             # geomeppy to_obj creates file without .obj extension
             obj_base = obj_path.with_suffix('')
             logger.info(f"Exporting to OBJ: {obj_path}")
-            idf.to_obj(str(obj_base))
+            from geomeppy.io.obj import ObjWriter
+            with _OBJ_WRITER_LOCK:
+                # Start empty, or the geometry of earlier exports is written too
+                ObjWriter.faces, ObjWriter.vertices, ObjWriter.v_set = [], [], set()
+                idf.to_obj(str(obj_base))
 
             # geomeppy creates file without extension - rename if needed
             obj_no_ext = obj_base
@@ -160,15 +383,7 @@ class GeometryExportService:
                 else:
                     raise GeometryExportError("OBJ file was not created")
 
-            result = {
-                "success": True,
-                "obj_path": str(obj_path),
-                "mtl_path": str(mtl_path) if mtl_path.exists() else None,
-                "message": f"Successfully exported to {obj_path}"
-            }
-
-            logger.info(f"OBJ export complete: {obj_path}")
-            return result
+            return obj_path
 
         except Exception as e:
             logger.error(f"OBJ export failed: {e}")
@@ -179,7 +394,8 @@ class GeometryExportService:
         idf_path: str,
         output_dir: Optional[str] = None,
         output_name: Optional[str] = None,
-        binary: bool = True
+        binary: bool = True,
+        compress: Compression = "none"
     ) -> Dict[str, Any]:
         """
         Export IDF geometry to glTF format.
@@ -189,91 +405,352 @@ class GeometryExportService:
             output_dir: Directory for output files (default: same as IDF)
             output_name: Base name for output files (default: IDF filename)
             binary: If True, export as .glb (single file). If False, .gltf + .bin
+            compress: "quantize" to store .glb vertex data as 16-bit
+                     integers, or "meshopt" to also compress it, both via
+                     gltfpack (skipped with a warning if it is missing).
+                     Viewers must support KHR_mesh_quantization, plus
+                     EXT_meshopt_compression for "meshopt".
 
         Returns:
             Dict with:
                 - success: bool
                 - gltf_path: Path to .glb or .gltf file
                 - format: "glb" or "gltf"
+                - compression: "quantize", "meshopt" or None
                 - file_size_bytes: Size of the output file
                 - message: Status message
         """
+        idf_path = Path(idf_path)
+
+        # Determine output paths
+        output_dir = Path(output_dir) if output_dir else idf_path.parent
+        output_name = output_name or idf_path.stem
+
+        cache_entry = None
+        if binary:
+            cache_entry = self._glb_cache_entry(idf_path, compress)
+            cached = self._restore_cached_glb(cache_entry, output_dir, output_name)
+            if cached is not None:
+                return cached
+
+        # OBJ intermediate goes to a temp directory
+        with tempfile.TemporaryDirectory() as temp_dir:
+            mesh = self._load_and_transform(idf_path, Path(temp_dir), output_name)
+
+        result = self._write_gltf(mesh, output_dir, output_name, binary, compress)
+        if binary:
+            self._store_cached_glb(cache_entry, Path(result["gltf_path"]))
+        return result
+
+    def _load_and_transform(
+        self,
+        idf_path: Path,
+        obj_dir: Path,
+        output_name: str,
+        obj_path: Optional[Path] = None
+    ):
+        """
+        Load the IDF geometry as a trimesh rotated for Blender orientation.
+
+        The mesh is built in memory from the IDF surfaces (see _build_mesh).
+        If that fails it falls back to loading an OBJ: ``obj_path`` when one
+        was already written for this IDF, otherwise one written to ``obj_dir``.
+        The parsed IDF comes from the process-wide _load_idf cache.
+        """
         try:
-            import trimesh
+            import trimesh  # noqa: F401
         except ImportError:
             raise GeometryExportError(
                 "trimesh not installed. Install with: pip install trimesh"
             )
 
-        idf_path = Path(idf_path)
+        if not idf_path.exists():
+            raise GeometryExportError(f"IDF file not found: {idf_path}")
 
-        # Determine output paths
-        output_dir = Path(output_dir) if output_dir else idf_path.parent
-        output_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            mesh = self._build_mesh(idf_path)
+        except Exception as e:
+            logger.warning(f"In-memory mesh build failed, falling back to OBJ: {e}")
+            mesh = None
 
-        output_name = output_name or idf_path.stem
+        if mesh is not None:
+            return mesh
 
-        # First export to OBJ (in temp directory)
-        with tempfile.TemporaryDirectory() as temp_dir:
-            obj_result = self.export_to_obj(
-                idf_path=str(idf_path),
-                output_dir=temp_dir,
-                output_name=output_name
+        if obj_path is None:
+            obj_path = self._write_obj(idf_path, obj_dir, output_name)
+
+        return self._load_obj_mesh(obj_path)
+
+    def _load_obj_mesh(self, obj_path: Path):
+        """Load an OBJ written by to_obj as a trimesh rotated for Blender orientation"""
+        import numpy as np
+        import trimesh
+
+        try:
+            # Load OBJ with trimesh
+            logger.info(f"Loading OBJ into trimesh: {obj_path}")
+            # Surfaces are already clean polygons: skip vertex merging,
+            # face reprocessing and validation
+            mesh = trimesh.load(str(obj_path), process=False, maintain_order=True)
+
+            # Rotate to correct orientation for Blender
+            # EnergyPlus: Z-up, but OBJ export has Y as depth
+            # Blender expects Z-up, so rotate -90° around X axis.
+            # That rotation is (x, y, z) -> (x, z, -y), so swap the vertex
+            # columns directly instead of a general 4x4 transform
+            geometries = (
+                mesh.geometry.values() if isinstance(mesh, trimesh.Scene) else [mesh]
             )
+            for geometry in geometries:
+                vertices = geometry.vertices
+                geometry.vertices = np.column_stack(
+                    (vertices[:, 0], vertices[:, 2], -vertices[:, 1])
+                )
+            logger.debug("Applied -90° X rotation for Blender orientation")
 
-            obj_path = obj_result["obj_path"]
+        except Exception as e:
+            logger.error(f"glTF conversion failed: {e}")
+            raise GeometryExportError(f"Failed to convert to glTF: {e}")
 
-            try:
-                # Load OBJ with trimesh
-                logger.info(f"Loading OBJ into trimesh: {obj_path}")
-                mesh = trimesh.load(obj_path)
-
-                # Rotate to correct orientation for Blender
-                # EnergyPlus: Z-up, but OBJ export has Y as depth
-                # Blender expects Z-up, so rotate -90° around X axis
-                import numpy as np
-                rotation_matrix = trimesh.transformations.rotation_matrix(
-                    np.radians(-90), [1, 0, 0]
+        return mesh
+
+    def _build_mesh(self, idf_path: Path):
+        """
+        Build a Blender-oriented trimesh scene straight from the IDF surfaces.
+
+        The geometry matches what to_obj writes: each wall with a window or
+        door has the opening cut out of it, every polygon is triangulated
+        (a fan when it is proven convex, otherwise constrained Delaunay, so
+        concave surfaces stay correct) and drawn
+        with both windings, and there is one mesh per surface type with the
+        colours of geomeppy's default.mtl. Vertices are written already
+        rotated (x, y, z) -> (x, z, -y), so no OBJ is written or parsed.
+        Returns None when the IDF has no surface polygons.
+        """
+        import numpy as np
+        import trimesh
+        from geomeppy.io.obj import ObjWriter
+
+        logger.info(f"Loading IDF: {idf_path}")
+        idf = self._load_idf(idf_path)
+
+        # to_obj only cuts the first subsurface of each host surface out of it
+        subsurfaces = {}
+        for subsurface in idf.getsubsurfaces():
+            subsurfaces.setdefault(subsurface.Building_Surface_Name, subsurface)
+
+        faces = _SurfaceFaces()
+        for surface in idf.getsurfaces():
+            subsurface = subsurfaces.get(surface.Name)
+            if subsurface is not None:
+                # geomeppy's own cut-out, collected rather than written
+                ObjWriter.build_surface_with_subsurface(faces, surface, subsurface)
+            else:
+                faces.add_face(surface.coords, surface.Surface_Type)
+        for shading in idf.getshadingsurfaces():
+            faces.add_face(shading.coords, "shading")
+
+        materials = _surface_materials()
+        geometries = {}
+        for material, polygons in faces.by_material.items():
+            polygons = [
+                np.asarray(polygon, dtype=np.float64)
+                for polygon in polygons if len(polygon) >= 3
+            ]
+            if not polygons:
+                continue
+
+            # All polygons of this surface type stacked into one (V, 3) array
+            points = np.concatenate(polygons)
+            sizes = np.array([len(polygon) for polygon in polygons])
+            offsets = np.cumsum(sizes) - sizes
+
+            # Convex polygons are fan-triangulated all at once; only the
+            # rest need a constrained Delaunay triangulation
+            convex = _convex_mask(points, sizes, offsets)
+            triangles = [_fan_triangles(sizes[convex], offsets[convex])]
+            for i in np.flatnonzero(~convex):
+                triangles.append(_triangulate(polygons[i]) + offsets[i])
+            triangles = np.concatenate(triangles)
+
+            vertices = np.column_stack((points[:, 0], points[:, 2], -points[:, 1]))
+            mesh = trimesh.Trimesh(
+                vertices=vertices,
+                # Both windings, so surfaces show from inside and behind
+                faces=np.concatenate((triangles, triangles[:, ::-1])),
+                process=False
+            )
+            if material in materials:
+                mesh.visual = trimesh.visual.TextureVisuals(
+                    material=trimesh.visual.material.SimpleMaterial(**materials[material])
                 )
-                mesh.apply_transform(rotation_matrix)
-                logger.debug("Applied -90° X rotation for Blender orientation")
+            geometries[material] = mesh
 
-                # Determine output format and path
-                if binary:
-                    gltf_path = output_dir / f"{output_name}.glb"
-                    format_type = "glb"
-                else:
-                    gltf_path = output_dir / f"{output_name}.gltf"
-                    format_type = "gltf"
+        if not geometries:
+            return None
 
-                # Export to glTF
-                logger.info(f"Exporting to glTF: {gltf_path}")
-                mesh.export(str(gltf_path))
+        logger.debug(
+            f"Built mesh from {len(faces)} polygons "
+            f"({sum(len(g.faces) for g in geometries.values())} faces)"
+        )
+        return trimesh.Scene(geometries)
 
-                # Get file size
-                file_size = gltf_path.stat().st_size
+    def _write_gltf(
+        self,
+        mesh,
+        output_dir: Path,
+        output_name: str,
+        binary: bool,
+        compress: Compression = "none"
+    ) -> Dict[str, Any]:
+        """Write an already-loaded mesh as .glb or .gltf and describe the result"""
+        output_dir.mkdir(parents=True, exist_ok=True)
 
-                result = {
-                    "success": True,
-                    "gltf_path": str(gltf_path),
-                    "format": format_type,
-                    "file_size_bytes": file_size,
-                    "message": f"Successfully exported to {gltf_path}"
-                }
+        # Determine output format and path
+        if binary:
+            gltf_path = output_dir / f"{output_name}.glb"
+            format_type = "glb"
+        else:
+            gltf_path = output_dir / f"{output_name}.gltf"
+            format_type = "gltf"
 
-                logger.info(f"glTF export complete: {gltf_path} ({file_size} bytes)")
-                return result
+        try:
+            # Export to glTF
+            logger.info(f"Exporting to glTF: {gltf_path}")
+            # Viewers derive flat normals when none are stored, so skip
+            # computing and writing them
+            mesh.export(str(gltf_path), include_normals=False)
 
-            except Exception as e:
-                logger.error(f"glTF conversion failed: {e}")
-                raise GeometryExportError(f"Failed to convert to glTF: {e}")
+            compression = None
+            if compress in _GLTFPACK_FLAGS and binary:
+                if self._pack_glb(gltf_path, _GLTFPACK_FLAGS[compress]):
+                    compression = compress
+
+            # Get file size
+            file_size = gltf_path.stat().st_size
+
+        except Exception as e:
+            logger.error(f"glTF conversion failed: {e}")
+            raise GeometryExportError(f"Failed to convert to glTF: {e}")
+
+        result = {
+            "success": True,
+            "gltf_path": str(gltf_path),
+            "format": format_type,
+            "compression": compression,
+            "file_size_bytes": file_size,
+            "message": f"Successfully exported to {gltf_path}"
+        }
+
+        logger.info(f"glTF export complete: {gltf_path} ({file_size} bytes)")
+        return result
+
+    def _glb_cache_entry(
+        self,
+        idf_path: Path,
+        compress: Compression
+    ) -> Optional[Tuple[Path, Compression]]:
+        """
+        Cache file for a .glb export and the compression it will carry.
+
+        The key covers the IDF bytes, the compression actually applied (so
+        installing gltfpack later does not serve stale uncompressed files)
+        and the mesh builder version. Returns None if the IDF cannot be read.
+        """
+        if compress not in _GLTFPACK_FLAGS or not shutil.which("gltfpack"):
+            compress = "none"
+        try:
+            data = idf_path.read_bytes()
+        except OSError:
+            return None
+        h = hashlib.blake2b(digest_size=16)
+        h.update(data)
+        h.update(repr(("glb", compress)).encode())
+        h.update(_glb_cache_tag())
+        return _glb_cache_dir() / f"{h.hexdigest()}.glb", compress
+
+    def _restore_cached_glb(
+        self,
+        cache_entry: Optional[Tuple[Path, Compression]],
+        output_dir: Path,
+        output_name: str
+    ) -> Optional[Dict[str, Any]]:
+        """Copy the cached .glb for a cache entry to the output path, if there is one"""
+        if cache_entry is None:
+            return None
+
+        cache_path, compression = cache_entry
+        if not cache_path.exists():
+            return None
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+        gltf_path = output_dir / f"{output_name}.glb"
+        shutil.copyfile(cache_path, gltf_path)
+        file_size = gltf_path.stat().st_size
+        try:
+            # Mark as recently used for _prune_glb_cache
+            os.utime(cache_path)
+        except OSError:
+            pass
+
+        logger.info(f"glTF export served from cache: {gltf_path} ({file_size} bytes)")
+        return {
+            "success": True,
+            "gltf_path": str(gltf_path),
+            "format": "glb",
+            "compression": None if compression == "none" else compression,
+            "file_size_bytes": file_size,
+            "message": f"Successfully exported to {gltf_path}"
+        }
+
+    def _store_cached_glb(
+        self,
+        cache_entry: Optional[Tuple[Path, Compression]],
+        glb_path: Path
+    ):
+        """Save a freshly written .glb to the export cache; failures are only logged"""
+        if cache_entry is None:
+            return
+        try:
+            cache_path, _ = cache_entry
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Copy then rename so concurrent readers never see a partial file
+            partial_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            shutil.copyfile(glb_path, partial_path)
+            os.replace(partial_path, cache_path)
+            _prune_glb_cache(cache_path.parent, GLB_CACHE_MAX_BYTES)
+        except OSError as e:
+            logger.warning(f"Could not cache glTF export: {e}")
+
+    def _pack_glb(self, glb_path: Path, flags: List[str]) -> bool:
+        """
+        Quantize (and with flags, compress) a .glb in place with gltfpack.
+
+        Returns False, leaving the file uncompressed, when gltfpack is not
+        installed.
+        """
+        gltfpack = shutil.which("gltfpack")
+        if not gltfpack:
+            logger.warning("gltfpack not found on PATH; writing uncompressed glTF")
+            return False
+
+        packed_path = glb_path.with_name(f"{glb_path.stem}.packed.glb")
+        logger.info(f"Packing glTF with gltfpack: {glb_path}")
+        subprocess.run(
+            [gltfpack, "-i", str(glb_path), "-o", str(packed_path), *flags],
+            check=True,
+            capture_output=True
+        )
+        os.replace(packed_path, glb_path)
+        return True
 
     def export(
         self,
         idf_path: str,
         output_dir: Optional[str] = None,
         output_name: Optional[str] = None,
-        formats: Optional[List[OutputFormat]] = None
+        formats: Optional[List[OutputFormat]] = None,
+        compress: Compression = "none"
     ) -> Dict[str, Any]:
         """
         Export IDF geometry to multiple formats.
@@ -284,6 +761,8 @@ class GeometryExportService:
             output_name: Base name for output files (default: IDF filename)
             formats: List of formats to export. Default: ["glb"]
                     Options: "obj", "glb", "gltf"
+            compress: "quantize" or "meshopt" to shrink the .glb output
+                     (see export_to_gltf)
 
         Returns:
             Dict with:
@@ -300,31 +779,61 @@ class GeometryExportService:
         exports = {}
         errors = []
 
-        for fmt in formats:
+        # The IDF is parsed once: an OBJ requested by the caller doubles as
+        # the intermediate for the glTF formats, and the loaded mesh is
+        # exported once per glTF variant
+        obj_path = None
+        if "obj" in formats:
             try:
-                if fmt == "obj":
-                    exports["obj"] = self.export_to_obj(
-                        idf_path=str(idf_path),
-                        output_dir=str(output_dir),
-                        output_name=output_name
-                    )
-                elif fmt == "glb":
-                    exports["glb"] = self.export_to_gltf(
-                        idf_path=str(idf_path),
-                        output_dir=str(output_dir),
-                        output_name=output_name,
-                        binary=True
-                    )
-                elif fmt == "gltf":
-                    exports["gltf"] = self.export_to_gltf(
-                        idf_path=str(idf_path),
-                        output_dir=str(output_dir),
-                        output_name=output_name,
-                        binary=False
+                exports["obj"] = self.export_to_obj(
+                    idf_path=str(idf_path),
+                    output_dir=str(output_dir),
+                    output_name=output_name
+                )
+                obj_path = Path(exports["obj"]["obj_path"])
+            except Exception as e:
+                errors.append(f"obj: {str(e)}")
+
+        glb_cache_entry = None
+        if "glb" in formats:
+            glb_cache_entry = self._glb_cache_entry(idf_path, compress)
+            try:
+                cached = self._restore_cached_glb(glb_cache_entry, output_dir, output_name)
+                if cached is not None:
+                    exports["glb"] = cached
+            except OSError as e:
+                logger.warning(f"Could not read cached glTF export: {e}")
+
+        gltf_formats = [
+            fmt for fmt in formats if fmt in ("glb", "gltf") and fmt not in exports
+        ]
+        mesh = None
+        mesh_error = None
+        if gltf_formats:
+            try:
+                with tempfile.TemporaryDirectory() as temp_dir:
+                    mesh = self._load_and_transform(
+                        idf_path, Path(temp_dir), output_name, obj_path=obj_path
                     )
-                else:
-                    errors.append(f"Unknown format: {fmt}")
+            except Exception as e:
+                mesh_error = e
 
+        for fmt in formats:
+            if fmt == "obj" or fmt in exports:
+                continue
+            if fmt not in ("glb", "gltf"):
+                errors.append(f"Unknown format: {fmt}")
+                continue
+            if mesh is None:
+                errors.append(f"{fmt}: {str(mesh_error)}")
+                continue
+            try:
+                exports[fmt] = self._write_gltf(
+                    mesh, output_dir, output_name,
+                    binary=(fmt == "glb"), compress=compress
+                )
+                if fmt == "glb":
+                    self._store_cached_glb(glb_cache_entry, Path(exports[fmt]["gltf_path"]))
             except Exception as e:
                 errors.append(f"{fmt}: {str(e)}")
 
@@ -349,16 +858,12 @@ class GeometryExportService:
         Returns:
             Dict with geometry statistics (zones, surfaces, vertices, etc.)
         """
-        self._ensure_idd()
-
-        from geomeppy import IDF
-
         idf_path = Path(idf_path)
         if not idf_path.exists():
             raise GeometryExportError(f"IDF file not found: {idf_path}")
 
         try:
-            idf = IDF(str(idf_path))
+            idf = self._load_idf(idf_path)
 
             # Count geometry objects
             zones = idf.idfobjects.get("ZONE", [])
@@ -368,15 +873,24 @@ class GeometryExportService:
 
             # Calculate total vertices
             total_vertices = 0
-            for surface in surfaces:
-                # Count vertex fields (X1, Y1, Z1, X2, Y2, Z2, ...)
-                vertex_count = 0
-                for i in range(1, 100):  # Max reasonable vertices
-                    if hasattr(surface, f"Vertex_{i}_Xcoordinate"):
-                        vertex_count += 1
-                    else:
-                        break
-                total_vertices += vertex_count
+            if surfaces:
+                # Vertex X fields are the same for every surface of this type,
+                # so look them up once rather than probing names per surface
+                vertex_fields = [
+                    f for f in surfaces[0].objls
+                    if f.startswith("Vertex_") and f.endswith("_Xcoordinate")
+                ]
+                for surface in surfaces:
+                    # Prefer the declared count; fall back to populated X fields
+                    try:
+                        vertex_count = int(surface.Number_of_Vertices or 0)
+                    except (AttributeError, TypeError, ValueError):
+                        vertex_count = 0
+                    if not vertex_count:
+                        vertex_count = sum(
+                            1 for f in vertex_fields if getattr(surface, f, "") != ""
+                        )
+                    total_vertices += vertex_count
 
             return {
                 "idf_path": str(idf_path),
@@ -11,18 +11,193 @@ Usage:
 """
 
 import os
+import asyncio
 import logging
+import functools
+import hashlib
+import importlib.util
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Set
 
 logger = logging.getLogger(__name__)
 
+# Concurrent uploads per folder; the storage client's httpx pool is shared
+# by all worker threads
+DEFAULT_UPLOAD_WORKERS = 16
+
+# Connection pool for storage requests. Idle connections are kept for all
+# upload workers, and HTTP/2 (when the h2 package is installed) multiplexes
+# concurrent uploads over one TLS connection
+STORAGE_MAX_KEEPALIVE_CONNECTIONS = 32
+STORAGE_KEEPALIVE_EXPIRY_SECONDS = 120
+
+# Read buffer for upload bodies; httpx pulls multipart file data in small
+# chunks, and a 1 MiB buffer turns those into few large disk reads
+UPLOAD_BUFFER_SIZE = 1024 * 1024
+
+# Files above this size are sent as a raw body with chunked transfer
+# encoding, read from disk as they go; smaller ones use storage3's
+# multipart upload, where a known Content-Length costs nothing
+STREAM_UPLOAD_THRESHOLD_BYTES = 8 * 1024 * 1024
+
+# Objects per bucket listing page (the API default is 100)
+LIST_PAGE_SIZE = 1000
+
+# Paths per remove request, and how many remove requests run at once
+REMOVE_BATCH_SIZE = 256
+REMOVE_WORKERS = 8
+
+# How long a list_folder result is reused before the bucket is listed again
+LIST_CACHE_TTL_SECONDS = 30
+
+# Attempts per file upload; transient failures (connection errors, 429 and
+# 5xx responses) are retried after 1 s, 2 s, 4 s (plus jitter)
+UPLOAD_MAX_ATTEMPTS = 4
+RETRY_BASE_DELAY_SECONDS = 1.0
+_RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+# MIME types for EnergyPlus outputs, by lowercase extension
+_MIME_TYPES = {
+    ".csv": "text/csv",
+    ".html": "text/html",
+    ".htm": "text/html",
+    ".json": "application/json",
+    ".idf": "text/plain",
+    ".epw": "text/plain",
+    ".sql": "application/x-sqlite3",
+    ".obj": "model/obj",
+    ".mtl": "text/plain",
+    ".glb": "model/gltf-binary",
+    ".gltf": "model/gltf+json",
+    ".txt": "text/plain",
+    ".err": "text/plain",
+    ".eso": "text/plain",
+    ".eio": "text/plain",
+    ".end": "text/plain",
+    ".rdd": "text/plain",
+    ".mdd": "text/plain",
+    ".mtd": "text/plain",
+    ".bnd": "text/plain",
+    ".shd": "text/plain",
+    ".dxf": "application/dxf",
+    ".audit": "text/plain",
+}
+
+
+@functools.lru_cache(maxsize=4)
+def _get_upload_executor(max_workers: int) -> ThreadPoolExecutor:
+    """
+    Long-lived upload thread pool, shared by all folder uploads.
+
+    Requests beyond max_workers wait in the pool's queue, so at most
+    max_workers uploads are in flight at once.
+    """
+    return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="supabase-upload")
+
 
 class SupabaseServiceError(Exception):
     """Custom exception for Supabase storage errors"""
     pass
 
 
+def _pooled_client_options():
+    """
+    Supabase client options with a keep-alive, HTTP/2 httpx session.
+
+    supabase-py otherwise builds the storage session with httpx defaults
+    (20 idle connections, 5 s keep-alive). A session passed as httpx_client
+    is adopted by the storage client, which sets its base URL and auth
+    headers. Returns None, for supabase-py's defaults, if the options cannot
+    be built (e.g. a supabase-py without httpx_client).
+    """
+    try:
+        import httpx
+        from storage3.constants import DEFAULT_TIMEOUT
+        from supabase import ClientOptions
+
+        return ClientOptions(httpx_client=httpx.Client(
+            timeout=DEFAULT_TIMEOUT,
+            follow_redirects=True,
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(
+                max_keepalive_connections=STORAGE_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=STORAGE_KEEPALIVE_EXPIRY_SECONDS
+            )
+        ))
+    except Exception as e:
+        logger.debug("Using default Supabase HTTP session: %s", e)
+        return None
+
+
+def _storage_session(client):
+    """
+    The storage client's httpx session, if requests can go through it directly.
+
+    Returns None when the session does not carry the storage base URL (as
+    with storage3 releases that build each request URL themselves), so the
+    caller can fall back to the storage3 API.
+    """
+    session = getattr(client.storage, "session", None)
+    if session is None or not str(getattr(session, "base_url", "")):
+        return None
+    return session
+
+
+# Supabase clients shared process-wide, keyed by (url, key). The sync httpx
+# sessions inside them are thread-safe, so services and worker threads can
+# all use the same client and connection pool
+_clients: Dict[tuple, Any] = {}
+_clients_lock = threading.Lock()
+
+
+def _get_shared_client(supabase_url: str, supabase_key: str):
+    """Get or create the process-wide Supabase client for a project and key"""
+    key = (supabase_url, supabase_key)
+    client = _clients.get(key)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                try:
+                    from supabase import create_client
+                except ImportError:
+                    raise SupabaseServiceError(
+                        "supabase-py not installed. Install with: pip install supabase"
+                    )
+
+                client = create_client(
+                    supabase_url, supabase_key, options=_pooled_client_options()
+                )
+                _clients[key] = client
+                logger.info("Connected to Supabase: %s", supabase_url)
+    return client
+
+
+def _is_transient_error(error: Exception) -> bool:
+    """Whether a failed storage request is worth retrying"""
+    try:
+        import httpx
+        if isinstance(error, httpx.TransportError):
+            return True
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in _RETRYABLE_STATUS_CODES
+    except ImportError:
+        pass
+
+    # storage3 raises StorageException with the API error dict as its argument
+    details = error.args[0] if error.args else None
+    if isinstance(details, dict):
+        try:
+            return int(details.get("statusCode", 0)) in _RETRYABLE_STATUS_CODES
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
 class SupabaseStorageService:
     """Service for uploading simulation files to Supabase storage"""
 
@@ -63,56 +238,50 @@ class SupabaseStorageService:
 
         self._client = None
 
-    def _get_client(self):
-        """Get or create Supabase client"""
-        if self._client is None:
-            try:
-                from supabase import create_client, Client
-            except ImportError:
-                raise SupabaseServiceError(
-                    "supabase-py not installed. Install with: pip install supabase"
-                )
+        # list_folder results by folder path: (monotonic expiry, result)
+        self._list_cache: Dict[str, tuple] = {}
+        self._list_cache_lock = threading.Lock()
 
-            self._client: Client = create_client(self.supabase_url, self.supabase_key)
-            logger.info(f"Connected to Supabase: {self.supabase_url}")
+    def _get_client(self):
+        """
+        Get the Supabase client; safe to call from upload worker threads.
 
+        Clients are shared at module level, so new SupabaseStorageService
+        instances for the same project reuse one client and its connections.
+        """
+        if self._client is None:
+            self._client = _get_shared_client(self.supabase_url, self.supabase_key)
         return self._client
 
-    def _get_mime_type(self, file_path: Path) -> str:
-        """Determine MIME type based on file extension"""
-        mime_types = {
-            ".csv": "text/csv",
-            ".html": "text/html",
-            ".htm": "text/html",
-            ".json": "application/json",
-            ".idf": "text/plain",
-            ".epw": "text/plain",
-            ".sql": "application/x-sqlite3",
-            ".obj": "model/obj",
-            ".mtl": "text/plain",
-            ".glb": "model/gltf-binary",
-            ".gltf": "model/gltf+json",
-            ".txt": "text/plain",
-            ".err": "text/plain",
-            ".eso": "text/plain",
-            ".eio": "text/plain",
-            ".end": "text/plain",
-            ".rdd": "text/plain",
-            ".mdd": "text/plain",
-            ".mtd": "text/plain",
-            ".bnd": "text/plain",
-            ".shd": "text/plain",
-            ".dxf": "application/dxf",
-            ".audit": "text/plain",
-        }
-        return mime_types.get(file_path.suffix.lower(), "application/octet-stream")
-
-    def _delete_folder(self, folder_path: str) -> bool:
+    def _list_all(self, folder_path: str) -> List[Dict[str, Any]]:
+        """List every object in a bucket folder, following pagination"""
+        bucket = self._get_client().storage.from_(self.bucket_name)
+        items: List[Dict[str, Any]] = []
+        offset = 0
+        while True:
+            page = bucket.list(folder_path, {"limit": LIST_PAGE_SIZE, "offset": offset})
+            if not page:
+                break
+            items.extend(page)
+            if len(page) < LIST_PAGE_SIZE:
+                break
+            offset += LIST_PAGE_SIZE
+        return items
+
+    def _delete_folder(
+        self,
+        folder_path: str,
+        keep: Optional[Set[str]] = None,
+        existing: Optional[List[Dict[str, Any]]] = None
+    ) -> bool:
         """
         Delete all files in a folder path in the bucket.
 
         Args:
             folder_path: The folder path in the bucket to delete
+            keep: File names to leave in place, e.g. files about to be
+                  overwritten by an upsert
+            existing: The folder listing, if already fetched
 
         Returns:
             True if deletion was successful or folder didn't exist
@@ -121,29 +290,115 @@ class SupabaseStorageService:
 
         try:
             # List all files in the folder
-            result = client.storage.from_(self.bucket_name).list(folder_path)
-
-            if result and len(result) > 0:
-                # Build list of file paths to delete
-                files_to_delete = [f"{folder_path}/{item['name']}" for item in result]
-                logger.info(f"Deleting {len(files_to_delete)} existing files from {folder_path}")
-
-                # Delete all files
-                client.storage.from_(self.bucket_name).remove(files_to_delete)
-                logger.info(f"Deleted existing folder contents: {folder_path}")
+            result = existing if existing is not None else self._list_all(folder_path)
+
+            # Build list of file paths to delete
+            files_to_delete = [
+                f"{folder_path}/{item['name']}" for item in result
+                if not keep or item["name"] not in keep
+            ]
+
+            if files_to_delete:
+                self._invalidate_listing(folder_path)
+                logger.info("Deleting %d existing files from %s", len(files_to_delete), folder_path)
+
+                # Delete in batches to bound the request size, sending the
+                # batches concurrently
+                bucket = client.storage.from_(self.bucket_name)
+                batches = [
+                    files_to_delete[i:i + REMOVE_BATCH_SIZE]
+                    for i in range(0, len(files_to_delete), REMOVE_BATCH_SIZE)
+                ]
+                if len(batches) == 1:
+                    bucket.remove(batches[0])
+                else:
+                    with ThreadPoolExecutor(
+                        max_workers=min(REMOVE_WORKERS, len(batches)),
+                        thread_name_prefix="supabase-remove"
+                    ) as executor:
+                        futures = [executor.submit(bucket.remove, batch) for batch in batches]
+                    for future in futures:
+                        # A failed batch is logged like a missing folder
+                        if future.exception() is not None:
+                            logger.debug("Failed to delete a batch from %s: %s", folder_path, future.exception())
+                logger.info("Deleted existing folder contents: %s", folder_path)
 
             return True
 
         except Exception as e:
             # If folder doesn't exist, that's fine
-            logger.debug(f"No existing folder to delete or error: {e}")
+            logger.debug("No existing folder to delete or error: %s", e)
             return True
 
+    @staticmethod
+    def _is_unchanged(file_path: Path, file_size: int, remote: Optional[Dict[str, Any]]) -> bool:
+        """
+        Whether a bucket object already holds this file's content.
+
+        Compares size first, then the local MD5 against the object's ETag.
+        Objects stored by multipart upload have a non-MD5 ETag and never match.
+        """
+        metadata = (remote or {}).get("metadata") or {}
+        etag = str(metadata.get("eTag") or "").strip('"')
+        if not etag or metadata.get("size") != file_size:
+            return False
+
+        md5 = hashlib.md5(usedforsecurity=False)
+        with open(file_path, "rb", buffering=UPLOAD_BUFFER_SIZE) as f:
+            for chunk in iter(lambda: f.read(UPLOAD_BUFFER_SIZE), b""):
+                md5.update(chunk)
+        return md5.hexdigest() == etag
+
+    def _upload_if_changed(
+        self,
+        file_path: Path,
+        file_size: int,
+        destination_path: str,
+        remote: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Upload a file unless the bucket already has identical content"""
+        if remote is not None and self._is_unchanged(file_path, file_size, remote):
+            logger.debug("Unchanged, skipped: %s", file_path.name)
+            return {
+                "success": True,
+                "skipped": True,
+                "file_name": file_path.name,
+                "destination_path": destination_path,
+                "size_bytes": 0,
+                "content_type": _MIME_TYPES.get(file_path.suffix.lower(), "application/octet-stream")
+            }
+        return self.upload_file(
+            file_path=str(file_path),
+            destination_path=destination_path,
+            upsert=True,  # Always upsert individual files
+            file_size=file_size
+        )
+
+    def _stream_upload(self, session, f, destination_path: str, content_type: str, upsert: bool) -> None:
+        """
+        POST a file to the storage object endpoint as a chunked raw body.
+
+        Uses the storage client's own session (base URL and auth headers,
+        see _storage_session), reading UPLOAD_BUFFER_SIZE bytes at a time, so
+        the server receives data while the rest of the file is still being read.
+        """
+        response = session.post(
+            f"object/{self.bucket_name}/{destination_path}",
+            content=iter(lambda: f.read(UPLOAD_BUFFER_SIZE), b""),
+            headers={
+                "content-type": content_type,
+                "cache-control": "max-age=3600",
+                "x-upsert": str(upsert).lower()
+            }
+        )
+        response.raise_for_status()
+
     def upload_file(
         self,
         file_path: str,
         destination_path: str,
-        upsert: bool = True
+        upsert: bool = True,
+        file_size: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Upload a single file to Supabase storage.
@@ -152,6 +407,7 @@ class SupabaseStorageService:
             file_path: Local path to the file
             destination_path: Path in the bucket (e.g., "folder/filename.csv")
             upsert: If True, overwrite existing file. If False, fail if exists.
+            file_size: Size of the file in bytes, if already known
 
         Returns:
             Dict with upload result
@@ -163,50 +419,81 @@ class SupabaseStorageService:
             raise SupabaseServiceError(f"File not found: {file_path}")
 
         try:
-            # Read file content
-            with open(file_path, "rb") as f:
-                file_content = f.read()
-
             # Determine content type
-            content_type = self._get_mime_type(file_path)
-
-            # Upload to Supabase storage
-            result = client.storage.from_(self.bucket_name).upload(
-                path=destination_path,
-                file=file_content,
-                file_options={
-                    "content-type": content_type,
-                    "upsert": str(upsert).lower()
-                }
-            )
-
-            logger.info(f"Uploaded: {file_path.name} -> {destination_path}")
+            content_type = _MIME_TYPES.get(file_path.suffix.lower(), "application/octet-stream")
+
+            # Upload to Supabase storage. The open file is passed through so
+            # httpx streams it in chunks rather than holding it all in memory
+            with open(file_path, "rb", buffering=UPLOAD_BUFFER_SIZE) as f:
+                if file_size is None:
+                    file_size = os.fstat(f.fileno()).st_size
+                stream_session = (
+                    _storage_session(client) if file_size > STREAM_UPLOAD_THRESHOLD_BYTES else None
+                )
+                for attempt in range(1, UPLOAD_MAX_ATTEMPTS + 1):
+                    try:
+                        if stream_session is not None:
+                            self._stream_upload(stream_session, f, destination_path, content_type, upsert)
+                        else:
+                            # storage3 pops keys from file_options, so build it per attempt
+                            client.storage.from_(self.bucket_name).upload(
+                                path=destination_path,
+                                file=f,
+                                file_options={
+                                    "content-type": content_type,
+                                    "upsert": str(upsert).lower()
+                                }
+                            )
+                        break
+                    except Exception as e:
+                        if attempt == UPLOAD_MAX_ATTEMPTS or not _is_transient_error(e):
+                            raise
+                        delay = RETRY_BASE_DELAY_SECONDS * 2 ** (attempt - 1)
+                        delay += random.uniform(0, delay / 2)
+                        logger.warning(
+                            "Upload of %s failed (attempt %d), retrying in %.1fs: %s",
+                            file_path.name, attempt, delay, e
+                        )
+                        time.sleep(delay)
+                        f.seek(0)
+
+            # Per-file detail at debug; upload_folder logs one summary line
+            logger.debug("Uploaded: %s -> %s", file_path.name, destination_path)
 
             return {
                 "success": True,
                 "file_name": file_path.name,
                 "destination_path": destination_path,
-                "size_bytes": len(file_content),
+                "size_bytes": file_size,
                 "content_type": content_type
             }
 
         except Exception as e:
-            logger.error(f"Failed to upload {file_path.name}: {e}")
+            logger.error("Failed to upload %s: %s", file_path.name, e)
             raise SupabaseServiceError(f"Upload failed for {file_path.name}: {e}")
 
     def upload_folder(
         self,
         source_folder: str,
         destination_folder: Optional[str] = None,
-        replace_existing: bool = True
+        replace_existing: bool = True,
+        max_workers: int = DEFAULT_UPLOAD_WORKERS,
+        skip_unchanged: bool = True
     ) -> Dict[str, Any]:
         """
         Upload all files from a folder to Supabase storage.
 
+        Files are uploaded concurrently, so the time taken is not the sum of
+        the per-file round trips.
+
         Args:
             source_folder: Path to the local folder containing files to upload
             destination_folder: Folder name in the bucket. If not provided, uses source folder name.
-            replace_existing: If True, delete existing folder contents before uploading.
+            replace_existing: If True, delete existing files in the bucket folder that
+                              are not part of this upload (the rest are overwritten).
+            max_workers: Maximum number of file uploads in flight at once
+            skip_unchanged: If True, files whose size and MD5 match the existing
+                            object's ETag are not uploaded again.
 
         Returns:
             Dict with:
@@ -214,9 +501,10 @@ class SupabaseStorageService:
                 - supabase_bucket: str - The bucket name
                 - supabase_folder: str - The folder path in the bucket
                 - files_uploaded: int - Number of files successfully uploaded
+                - files_skipped: int - Number of files already up to date in the bucket
                 - files_failed: int - Number of files that failed
                 - total_size_bytes: int - Total size of uploaded files
-                - files: List of uploaded file details
+                - files: List of uploaded (and skipped) file details
                 - errors: List of any errors encountered
         """
         source_path = Path(source_folder)
@@ -230,32 +518,60 @@ class SupabaseStorageService:
         # Use source folder name if destination not specified
         folder_name = destination_folder or source_path.name
 
-        # Get list of files to upload
-        files_to_upload = [f for f in source_path.iterdir() if f.is_file()]
+        # Get (path, size) of the files to upload; DirEntry caches its type
+        # and stat, so each file is stat-ed at most once
+        with os.scandir(source_path) as it:
+            files_to_upload = [
+                (Path(entry.path), entry.stat().st_size) for entry in it if entry.is_file()
+            ]
 
         if not files_to_upload:
             raise SupabaseServiceError(f"No files found in source folder: {source_folder}")
 
-        logger.info(f"Preparing to upload {len(files_to_upload)} files to {self.bucket_name}/{folder_name}")
+        logger.info("Preparing to upload %d files to %s/%s", len(files_to_upload), self.bucket_name, folder_name)
+
+        # One listing of the bucket folder serves both the cleanup and the
+        # unchanged-file check
+        remote_items: Optional[List[Dict[str, Any]]] = None
+        if replace_existing or skip_unchanged:
+            try:
+                remote_items = self._list_all(folder_name)
+            except Exception as e:
+                logger.debug("Could not list existing folder %s: %s", folder_name, e)
+                remote_items = []
 
-        # Delete existing folder contents if requested
+        # Delete existing folder contents if requested. Files with the same
+        # name are upserted anyway, so only the ones not being uploaded go
         if replace_existing:
-            self._delete_folder(folder_name)
+            self._delete_folder(
+                folder_name, keep={f.name for f, _ in files_to_upload}, existing=remote_items
+            )
+
+        remote_by_name = (
+            {item["name"]: item for item in remote_items} if skip_unchanged and remote_items else {}
+        )
 
         # Upload each file
         uploaded_files: List[Dict[str, Any]] = []
         failed_files: List[Dict[str, Any]] = []
         total_size = 0
 
-        for file_path in files_to_upload:
-            destination_path = f"{folder_name}/{file_path.name}"
+        executor = _get_upload_executor(max(1, max_workers))
+        futures = {
+            executor.submit(
+                self._upload_if_changed,
+                file_path,
+                file_size,
+                f"{folder_name}/{file_path.name}",
+                remote_by_name.get(file_path.name)
+            ): file_path
+            for file_path, file_size in files_to_upload
+        }
 
+        for future in as_completed(futures):
+            file_path = futures[future]
             try:
-                result = self.upload_file(
-                    file_path=str(file_path),
-                    destination_path=destination_path,
-                    upsert=True  # Always upsert individual files
-                )
+                result = future.result()
                 uploaded_files.append(result)
                 total_size += result["size_bytes"]
 
@@ -265,16 +581,21 @@ class SupabaseStorageService:
                     "error": str(e)
                 }
                 failed_files.append(error_info)
-                logger.error(f"Failed to upload {file_path.name}: {e}")
+                logger.error("Failed to upload %s: %s", file_path.name, e)
+
+        # Listings taken before or during the uploads are stale now
+        self._invalidate_listing(folder_name)
 
         # Build result
         success = len(failed_files) == 0
+        files_skipped = sum(1 for f in uploaded_files if f.get("skipped"))
 
         result = {
             "success": success,
             "supabase_bucket": self.bucket_name,
             "supabase_folder": folder_name,
-            "files_uploaded": len(uploaded_files),
+            "files_uploaded": len(uploaded_files) - files_skipped,
+            "files_skipped": files_skipped,
             "files_failed": len(failed_files),
             "total_size_bytes": total_size,
             "files": uploaded_files
@@ -283,39 +604,82 @@ class SupabaseStorageService:
         if failed_files:
             result["errors"] = failed_files
 
-        log_msg = f"Upload complete: {len(uploaded_files)} succeeded, {len(failed_files)} failed"
-        if success:
-            logger.info(log_msg)
-        else:
-            logger.warning(log_msg)
+        logger.log(
+            logging.INFO if success else logging.WARNING,
+            "Upload complete: %d succeeded, %d unchanged, %d failed",
+            len(uploaded_files) - files_skipped, files_skipped, len(failed_files)
+        )
 
         return result
 
-    def list_folder(self, folder_path: str) -> Dict[str, Any]:
+    def _invalidate_listing(self, folder_path: str) -> None:
+        """Drop the cached list_folder result for a folder this service changed"""
+        with self._list_cache_lock:
+            self._list_cache.pop(folder_path, None)
+
+    async def upload_folder_async(
+        self,
+        source_folder: str,
+        destination_folder: Optional[str] = None,
+        replace_existing: bool = True,
+        max_workers: int = DEFAULT_UPLOAD_WORKERS,
+        skip_unchanged: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Awaitable upload_folder for async (FastAPI/MCP) handlers.
+
+        The folder scan and listing run in a worker thread and the uploads on
+        the shared upload pool, so the event loop keeps serving other
+        requests meanwhile. Arguments and result are as for upload_folder.
+        """
+        return await asyncio.to_thread(
+            self.upload_folder,
+            source_folder=source_folder,
+            destination_folder=destination_folder,
+            replace_existing=replace_existing,
+            max_workers=max_workers,
+            skip_unchanged=skip_unchanged
+        )
+
+    def list_folder(self, folder_path: str, force_refresh: bool = False) -> Dict[str, Any]:
         """
         List files in a bucket folder.
 
+        Results are reused for LIST_CACHE_TTL_SECONDS; uploads and deletes
+        made through this service invalidate them.
+
         Args:
             folder_path: Path to the folder in the bucket
+            force_refresh: If True, list the bucket even if a cached result exists
 
         Returns:
             Dict with list of files
         """
-        client = self._get_client()
+        if not force_refresh:
+            with self._list_cache_lock:
+                cached = self._list_cache.get(folder_path)
+            if cached is not None and cached[0] > time.monotonic():
+                return dict(cached[1])
+
+        # Raises configuration errors as they are, outside the listing's wrapper
+        self._get_client()
 
         try:
-            result = client.storage.from_(self.bucket_name).list(folder_path)
+            result = self._list_all(folder_path)
 
-            files = []
-            for item in result:
-                files.append({
+            prefix = f"{folder_path}/"
+            files = [
+                {
                     "name": item["name"],
-                    "path": f"{folder_path}/{item['name']}",
-                    "size_bytes": item.get("metadata", {}).get("size"),
+                    "path": prefix + item["name"],
+                    # Folder placeholders carry metadata=None
+                    "size_bytes": (item.get("metadata") or {}).get("size"),
                     "last_modified": item.get("updated_at")
-                })
+                }
+                for item in result
+            ]
 
-            return {
+            result = {
                 "success": True,
                 "bucket": self.bucket_name,
                 "folder": folder_path,
@@ -323,8 +687,12 @@ class SupabaseStorageService:
                 "files": files
             }
 
+            with self._list_cache_lock:
+                self._list_cache[folder_path] = (time.monotonic() + LIST_CACHE_TTL_SECONDS, result)
+            return dict(result)
+
         except Exception as e:
-            logger.error(f"Failed to list folder {folder_path}: {e}")
+            logger.error("Failed to list folder %s: %s", folder_path, e)
             raise SupabaseServiceError(f"Failed to list folder: {e}")
 
     def get_public_url(self, file_path: str) -> str:
@@ -9,20 +9,126 @@ any required approvals from the U.S. Dept. of Energy). All rights reserved.
 See License.txt in the parent directory for license details.
 """
 
-import json
+import functools
 import logging
+import mmap
+import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass
+from typing import Dict, Any, Optional, List, Set
+from dataclasses import dataclass, field
 from datetime import datetime
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 # Template directory relative to project root
 TEMPLATES_DIR = Path(__file__).parent.parent.parent / "templates"
 SCHEMAS_DIR = Path(__file__).parent.parent.parent / "schemas"
 
+# Threads used to read template metadata files when loading them all
+TEMPLATE_LOAD_WORKERS = 8
+
+# IDF rewrite patterns, compiled once at import. Spans between an object
+# name and the field being rewritten are bounded (_SPAN), so a failed match
+# gives up after a few KB instead of scanning to the end of the model
+_SPAN = r".{0,2048}?"
+_RE_LOCATION = re.compile(r"(Site:Location,\s*)[^;]+(;)", re.DOTALL)
+_RE_BUILDING = re.compile(r"(Building,\s*[^,]+,\s*)([0-9.-]+)(,)")
+_RE_VERTEX = re.compile(r"\s*([0-9.-]+)\s*,\s*([0-9.-]+)\s*,\s*([0-9.-]+)\s*([,;])\s*(!.*)?")
+_RE_ITE = re.compile(r"(ElectricEquipment:ITE:AirCooled," + _SPAN + r"Watts/Unit,\s*)(\d+)(,\s*\d+)", re.DOTALL)
+_RE_EXTLIGHTS = re.compile(r"(  Exterior:Lights,)")
+_RE_OUTPUT = re.compile(r"(  Output:)")
+_RE_COOLING_SP = re.compile(r"(Cooling Return Air Setpoint Schedule" + _SPAN + r"Until: 24:00,)([0-9.-]+)(;)", re.DOTALL)
+_RE_HEATING_SP = re.compile(r"(Heating Setpoint Schedule" + _SPAN + r"Until: 24:00,)([0-9.-]+)(;)", re.DOTALL)
+_RE_SIMCTRL = re.compile(
+    r"(SimulationControl," + _SPAN + r"Run Simulation for Sizing Periods,\s*)(Yes|No)"
+    r"(," + _SPAN + r"Run Simulation for Weather File Run Periods,\s*)(Yes|No)",
+    re.DOTALL
+)
+
+# Header written at the top of every generated IDF
+_METADATA_COMMENT_TMPL = (
+    "! =========================================================================\n"
+    "! Generated by EnergyPlus MCP Server\n"
+    "! Template: %s\n"
+    "! Generated: %s\n"
+    "! Project: %s\n"
+    "! Project ID: %s\n"
+    "! Location: %s\n"
+    "! =========================================================================\n"
+    "\n"
+)
+
+# Replacement Site:Location object
+_SITE_LOCATION_TMPL = """Site:Location,
+    {site_name},  !- Name
+    {lat},                   !- Latitude {{deg}}
+    {lon},                   !- Longitude {{deg}}
+    {tz},                    !- Time Zone {{hr}}
+    {elev};   !- Elevation {{m}}"""
+
+# Process load object added to the warehouse BulkStorage zone
+_PROCESS_EQUIPMENT_TMPL = """
+  ElectricEquipment,
+    BulkStorage_ProcessLoad, !- Name
+    BulkStorage,             !- Zone or ZoneList Name
+    BLDG_EQUIP_SCH,          !- Schedule Name
+    EquipmentLevel,          !- Design Level Calculation Method
+    {process_load_w:.1f},    !- Design Level {{W}}
+    ,                        !- Watts per Zone Floor Area {{W/m2}}
+    ,                        !- Watts per Person {{W/person}}
+    0,                       !- Fraction Latent
+    {heat_fraction:.2f},     !- Fraction Radiant
+    0,                       !- Fraction Lost
+    Manufacturing Process Equipment;  !- End-Use Subcategory
+
+"""
+
+# building_spec section -> (building type it is limited to, TemplateService
+# method applying it), in the order the rewrites are applied
+_SPEC_MUTATORS = (
+    ("location", None, "_apply_location"),
+    ("geometry", None, "_apply_geometry"),
+    ("data_center", "data_center", "_apply_data_center_params"),
+    ("manufacturing", "manufacturing", "_apply_manufacturing_params"),
+    ("setpoints", None, "_apply_setpoints"),
+    ("simulation_options", None, "_apply_simulation_options"),
+)
+
+
+@functools.lru_cache(maxsize=16)
+def _read_template_text(path: str, mtime_ns: int) -> str:
+    """Template IDF text; the mtime key invalidates the entry when the file changes"""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        # Decode straight from the mapped pages, without an intermediate bytes copy
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            text = str(mm, "utf-8")
+    # Same line endings a text-mode read would give
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+# Output directories already created by this process
+_ENSURED_DIRS: Set[str] = set()
+
+
+def _write_model(output_path: Path, header: str, body: str) -> None:
+    """Write a generated IDF, creating its directory on first use"""
+    parent = str(output_path.parent)
+    if parent not in _ENSURED_DIRS:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(parent)
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(header)
+        f.write(body)
+
 
 @dataclass
 class TemplateInfo:
@@ -35,6 +141,18 @@ class TemplateInfo:
     idf_path: Path
     metadata_path: Path
     defaults: Dict[str, Any]
+    # list_templates entry, built once; shared, so callers must not mutate it
+    summary: Dict[str, Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.summary = {
+            "template_id": self.template_id,
+            "name": self.name,
+            "description": self.description,
+            "building_type": self.building_type,
+            "hvac_system": self.hvac_system,
+            "defaults": self.defaults
+        }
 
 
 class TemplateServiceError(Exception):
@@ -56,16 +174,24 @@ class TemplateService:
         """
         Initialize the template service.
 
+        Only the template file names are indexed here; metadata JSON is
+        parsed on first access to each template.
+
         Args:
             templates_dir: Optional custom templates directory path
         """
         self.templates_dir = Path(templates_dir) if templates_dir else TEMPLATES_DIR
+        self._template_index: Dict[str, Path] = {}
         self._templates_cache: Dict[str, TemplateInfo] = {}
-        self._load_templates()
-        logger.info(f"TemplateService initialized with {len(self._templates_cache)} templates")
-
-    def _load_templates(self):
-        """Scan templates directory and load metadata"""
+        self._all_loaded = False
+        self._by_type: Dict[str, List[str]] = {}
+        self._list_cache: Dict[Optional[str], List[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self._index_templates()
+        logger.info(f"TemplateService initialized with {len(self._template_index)} indexed templates")
+
+    def _index_templates(self):
+        """Index metadata files by name without opening them"""
         if not self.templates_dir.exists():
             logger.warning(f"Templates directory does not exist: {self.templates_dir}")
             return
@@ -75,35 +201,70 @@ class TemplateService:
                 continue
 
             for json_file in category_dir.glob("*.json"):
-                try:
-                    with open(json_file, "r", encoding="utf-8") as f:
-                        metadata = json.load(f)
-
-                    template_id = metadata.get("template_id")
-                    if not template_id:
-                        continue
-
-                    idf_file = metadata.get("idf_file")
-                    idf_path = category_dir / idf_file
-
-                    if not idf_path.exists():
-                        logger.warning(f"IDF file not found for template {template_id}: {idf_path}")
-                        continue
-
-                    self._templates_cache[template_id] = TemplateInfo(
-                        template_id=template_id,
-                        name=metadata.get("name", template_id),
-                        description=metadata.get("description", ""),
-                        building_type=metadata.get("building_type", "unknown"),
-                        hvac_system=metadata.get("hvac_system", "unknown"),
-                        idf_path=idf_path,
-                        metadata_path=json_file,
-                        defaults=metadata.get("defaults", {})
-                    )
-                    logger.debug(f"Loaded template: {template_id}")
-
-                except Exception as e:
-                    logger.error(f"Error loading template from {json_file}: {e}")
+                self._template_index[json_file.stem] = json_file
+
+    def _materialize(self, json_file: Path) -> Optional[TemplateInfo]:
+        """Parse one metadata file into a TemplateInfo, or None if unusable"""
+        try:
+            with open(json_file, "rb") as f:
+                metadata = orjson.loads(f.read())
+
+            template_id = metadata.get("template_id")
+            if not template_id:
+                return None
+
+            idf_file = metadata.get("idf_file")
+            idf_path = json_file.parent / idf_file
+
+            if not idf_path.exists():
+                logger.warning(f"IDF file not found for template {template_id}: {idf_path}")
+                return None
+
+            logger.debug(f"Loaded template: {template_id}")
+            return TemplateInfo(
+                template_id=template_id,
+                name=metadata.get("name", template_id),
+                description=metadata.get("description", ""),
+                building_type=metadata.get("building_type", "unknown"),
+                hvac_system=metadata.get("hvac_system", "unknown"),
+                idf_path=idf_path,
+                metadata_path=json_file,
+                defaults=metadata.get("defaults", {})
+            )
+
+        except Exception as e:
+            logger.error(f"Error loading template from {json_file}: {e}")
+            return None
+
+    def _load_templates(self):
+        """Materialize every indexed template, keeping index order"""
+        if self._all_loaded:
+            return
+        with self._lock:
+            if self._all_loaded:
+                return
+            loaded = {info.metadata_path: info for info in self._templates_cache.values()}
+            pending = [p for p in self._template_index.values() if p not in loaded]
+            if len(pending) > 1:
+                # Overlap the file reads; map() keeps index order
+                with ThreadPoolExecutor(max_workers=min(TEMPLATE_LOAD_WORKERS, len(pending))) as executor:
+                    loaded.update(zip(pending, executor.map(self._materialize, pending)))
+            else:
+                loaded.update((p, self._materialize(p)) for p in pending)
+
+            templates: Dict[str, TemplateInfo] = {}
+            for json_file in self._template_index.values():
+                info = loaded[json_file]
+                if info is not None:
+                    templates[info.template_id] = info
+
+            by_type: Dict[str, List[str]] = {}
+            for template_id, info in templates.items():
+                by_type.setdefault(info.building_type, []).append(template_id)
+            self._templates_cache = templates
+            self._by_type = by_type
+            self._list_cache.clear()
+            self._all_loaded = True
 
     def list_templates(self, building_type: Optional[str] = None) -> List[Dict[str, Any]]:
         """
@@ -115,19 +276,19 @@ class TemplateService:
         Returns:
             List of template information dictionaries
         """
-        templates = []
-        for template_id, info in self._templates_cache.items():
-            if building_type and info.building_type != building_type:
-                continue
-            templates.append({
-                "template_id": template_id,
-                "name": info.name,
-                "description": info.description,
-                "building_type": info.building_type,
-                "hvac_system": info.hvac_system,
-                "defaults": info.defaults
-            })
-        return templates
+        cached = self._list_cache.get(building_type)
+        if cached is not None:
+            return list(cached)
+
+        self._load_templates()
+        if building_type:
+            template_ids = self._by_type.get(building_type, [])
+        else:
+            template_ids = self._templates_cache.keys()
+
+        templates = [self._templates_cache[template_id].summary for template_id in template_ids]
+        self._list_cache[building_type] = templates
+        return list(templates)
 
     def get_template(self, template_id: str) -> TemplateInfo:
         """
@@ -142,6 +303,20 @@ class TemplateService:
         Raises:
             TemplateServiceError: If template not found
         """
+        info = self._templates_cache.get(template_id)
+        if info is not None:
+            return info
+
+        # Metadata files are named after their template, so try the
+        # matching file before falling back to a full load
+        json_file = self._template_index.get(template_id)
+        if json_file is not None and not self._all_loaded:
+            info = self._materialize(json_file)
+            if info is not None and info.template_id == template_id:
+                with self._lock:
+                    return self._templates_cache.setdefault(template_id, info)
+
+        self._load_templates()
         if template_id not in self._templates_cache:
             available = list(self._templates_cache.keys())
             raise TemplateServiceError(
@@ -174,64 +349,34 @@ class TemplateService:
         template = self.get_template(template_id)
         logger.info(f"Generating model from template: {template_id}")
 
-        # Load the template IDF
-        with open(template.idf_path, "r", encoding="utf-8") as f:
-            idf_content = f.read()
+        # Load the template IDF (cached until the file changes)
+        idf_path = str(template.idf_path)
+        idf_content = _read_template_text(idf_path, os.stat(idf_path).st_mtime_ns)
 
-        # Track applied modifications
+        # Apply each building_spec section present, in pipeline order
         modifications = []
+        spec_type = building_spec.get("building_type")
+        geometry_defaults = template.defaults.get("geometry", {})
+        for key, only_type, method_name in _SPEC_MUTATORS:
+            section = building_spec.get(key)
+            if section is None or (only_type and spec_type != only_type):
+                continue
+            args = (section, geometry_defaults) if key == "geometry" else (section,)
+            idf_content, mods = getattr(self, method_name)(idf_content, *args)
+            modifications.extend(mods)
 
-        # Apply location modifications
-        if "location" in building_spec:
-            idf_content, loc_mods = self._apply_location(
-                idf_content, building_spec["location"]
-            )
-            modifications.extend(loc_mods)
-
-        # Apply geometry modifications
-        if "geometry" in building_spec:
-            idf_content, geo_mods = self._apply_geometry(
-                idf_content, building_spec["geometry"], template.defaults.get("geometry", {})
-            )
-            modifications.extend(geo_mods)
-
-        # Apply data center specific modifications
-        if building_spec.get("building_type") == "data_center" and "data_center" in building_spec:
-            idf_content, dc_mods = self._apply_data_center_params(
-                idf_content, building_spec["data_center"]
-            )
-            modifications.extend(dc_mods)
-
-        # Apply manufacturing specific modifications
-        if building_spec.get("building_type") == "manufacturing" and "manufacturing" in building_spec:
-            idf_content, mfg_mods = self._apply_manufacturing_params(
-                idf_content, building_spec["manufacturing"]
-            )
-            modifications.extend(mfg_mods)
-
-        # Apply setpoint modifications
-        if "setpoints" in building_spec:
-            idf_content, sp_mods = self._apply_setpoints(
-                idf_content, building_spec["setpoints"]
-            )
-            modifications.extend(sp_mods)
-
-        # Apply simulation options
-        if "simulation_options" in building_spec:
-            idf_content, sim_mods = self._apply_simulation_options(
-                idf_content, building_spec["simulation_options"]
-            )
-            modifications.extend(sim_mods)
-
-        # Add generation metadata as comment
+        # Generation metadata is written as a comment ahead of the model,
+        # without concatenating it onto the full IDF text
         metadata_comment = self._generate_metadata_comment(building_spec, template_id)
-        idf_content = metadata_comment + idf_content
 
         # Save the generated IDF
         output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(idf_content)
+        try:
+            _write_model(output_path, metadata_comment, idf_content)
+        except FileNotFoundError:
+            # The output directory was removed since it was last created
+            _ENSURED_DIRS.discard(str(output_path.parent))
+            _write_model(output_path, metadata_comment, idf_content)
 
         logger.info(f"Generated model saved to: {output_path}")
 
@@ -251,16 +396,22 @@ class TemplateService:
             "warehouse": "Manufacturing_Warehouse",
         }
         template_id = type_mapping.get(building_type)
-        if not template_id or template_id not in self._templates_cache:
-            # Default to first available template of this type
-            for tid, info in self._templates_cache.items():
-                if info.building_type == building_type:
-                    return tid
-            # Fall back to any available template
-            if self._templates_cache:
-                return next(iter(self._templates_cache.keys()))
-            raise TemplateServiceError(f"No template available for building type: {building_type}")
-        return template_id
+        if template_id:
+            try:
+                self.get_template(template_id)
+                return template_id
+            except TemplateServiceError:
+                pass
+
+        self._load_templates()
+        # Default to first available template of this type
+        same_type = self._by_type.get(building_type)
+        if same_type:
+            return same_type[0]
+        # Fall back to any available template
+        if self._templates_cache:
+            return next(iter(self._templates_cache.keys()))
+        raise TemplateServiceError(f"No template available for building type: {building_type}")
 
     def _apply_location(
         self, idf_content: str, location: Dict[str, Any]
@@ -278,17 +429,14 @@ class TemplateService:
             tz = round(lon / 15)
 
             # Find and replace Site:Location object
-            location_pattern = r"(Site:Location,\s*)[^;]+(;)"
-
-            new_location = f"""Site:Location,
-    {site_name},  !- Name
-    {lat},                   !- Latitude {{deg}}
-    {lon},                   !- Longitude {{deg}}
-    {tz},                    !- Time Zone {{hr}}
-    {elev if elev else 0};   !- Elevation {{m}}"""
+            new_location = _SITE_LOCATION_TMPL.format(
+                site_name=site_name, lat=lat, lon=lon, tz=tz, elev=elev if elev else 0
+            )
 
-            if re.search(location_pattern, idf_content, re.DOTALL):
-                idf_content = re.sub(location_pattern, new_location, idf_content, flags=re.DOTALL)
+            replaced = 0
+            if "Site:Location" in idf_content:
+                idf_content, replaced = _RE_LOCATION.subn(lambda m: new_location, idf_content, count=1)
+            if replaced:
                 modifications.append(f"Updated Site:Location to {site_name} ({lat}, {lon})")
 
         return idf_content, modifications
@@ -323,13 +471,12 @@ class TemplateService:
         orientation = geometry.get("orientation_deg")
         if orientation is not None:
             # Update Building north axis
-            building_pattern = r"(Building,\s*[^,]+,\s*)([0-9.-]+)(,)"
-            idf_content = re.sub(
-                building_pattern,
-                f"\\g<1>{orientation}\\3",
-                idf_content,
-                count=1
-            )
+            if "Building," in idf_content:
+                idf_content = _RE_BUILDING.sub(
+                    lambda m: f"{m.group(1)}{orientation}{m.group(3)}",
+                    idf_content,
+                    count=1
+                )
             modifications.append(f"Set building orientation to {orientation} degrees")
 
         return idf_content, modifications
@@ -341,43 +488,48 @@ class TemplateService:
         # This is a simplified approach - scales numeric values in vertex coordinates
         # A more robust approach would parse the IDF properly
 
+        import numpy as np
+
         lines = idf_content.split("\n")
-        result_lines = []
+        vertex_lines = []
+        vertex_matches = []
         in_surface = False
-        vertex_count = 0
 
-        for line in lines:
+        # Locate vertex lines inside BuildingSurface:Detailed objects
+        for index, line in enumerate(lines):
             if "BuildingSurface:Detailed" in line:
                 in_surface = True
-                vertex_count = 0
-                result_lines.append(line)
                 continue
 
             if in_surface:
-                # Check for vertex coordinate lines (contain X,Y,Z pattern)
-                vertex_match = re.match(
-                    r"\s*([0-9.-]+)\s*,\s*([0-9.-]+)\s*,\s*([0-9.-]+)\s*([,;])\s*(!.*)?",
-                    line
-                )
+                # Check for vertex coordinate lines (contain X,Y,Z pattern);
+                # a line without a comma cannot be one, so skip the regex
+                vertex_match = _RE_VERTEX.match(line) if "," in line else None
                 if vertex_match:
-                    x = float(vertex_match.group(1)) * scale_x
-                    y = float(vertex_match.group(2)) * scale_y
-                    z = float(vertex_match.group(3)) * scale_z
-                    separator = vertex_match.group(4)
-                    comment = vertex_match.group(5) or ""
-
-                    result_lines.append(f"    {x:.6f},{y:.6f},{z:.6f}{separator}  {comment}")
-
-                    if separator == ";":
+                    vertex_lines.append(index)
+                    vertex_matches.append(vertex_match)
+                    if vertex_match.group(4) == ";":
                         in_surface = False
                     continue
 
                 if line.strip().endswith(";"):
                     in_surface = False
 
-            result_lines.append(line)
+        if not vertex_matches:
+            return idf_content
 
-        return "\n".join(result_lines)
+        # Scale every vertex in one array operation, then splice back
+        coords = np.fromiter(
+            (float(value) for match in vertex_matches for value in match.group(1, 2, 3)),
+            dtype=np.float64,
+            count=3 * len(vertex_matches)
+        ).reshape(-1, 3)
+        coords *= np.array([scale_x, scale_y, scale_z])
+
+        for index, match, (x, y, z) in zip(vertex_lines, vertex_matches, coords.tolist()):
+            lines[index] = "    %.6f,%.6f,%.6f%s  %s" % (x, y, z, match.group(4), match.group(5) or "")
+
+        return "\n".join(lines)
 
     def _apply_data_center_params(
         self, idf_content: str, dc_params: Dict[str, Any]
@@ -396,14 +548,11 @@ class TemplateService:
             it_load_kw = (rack_count * watts_per_rack) / 1000
 
         if rack_count is not None:
-            # Update Number of Units in ElectricEquipment:ITE:AirCooled
-            pattern = r"(ElectricEquipment:ITE:AirCooled,.*?Watts/Unit,\s*)(\d+)(,\s*\d+)"
-            idf_content = re.sub(
-                pattern,
-                f"\\g<1>{int(watts_per_rack) if watts_per_rack else 500},\n    {rack_count}",
-                idf_content,
-                flags=re.DOTALL
-            )
+            # Update Number of Units in ElectricEquipment:ITE:AirCooled; the
+            # substring check avoids the DOTALL scan when there is none
+            if "ElectricEquipment:ITE:AirCooled" in idf_content:
+                units = "%d,\n    %s" % (int(watts_per_rack) if watts_per_rack else 500, rack_count)
+                idf_content = _RE_ITE.sub(lambda m: m.group(1) + units, idf_content, count=1)
             modifications.append(f"Set IT equipment: {rack_count} units at {watts_per_rack:.0f}W each")
 
         return idf_content, modifications
@@ -423,30 +572,19 @@ class TemplateService:
 
             # Find a good insertion point - after existing ElectricEquipment
             # Add a new ElectricEquipment object for process loads
-            process_equipment = f"""
-  ElectricEquipment,
-    BulkStorage_ProcessLoad, !- Name
-    BulkStorage,             !- Zone or ZoneList Name
-    BLDG_EQUIP_SCH,          !- Schedule Name
-    EquipmentLevel,          !- Design Level Calculation Method
-    {process_load_w:.1f},    !- Design Level {{W}}
-    ,                        !- Watts per Zone Floor Area {{W/m2}}
-    ,                        !- Watts per Person {{W/person}}
-    0,                       !- Fraction Latent
-    {heat_fraction:.2f},     !- Fraction Radiant
-    0,                       !- Fraction Lost
-    Manufacturing Process Equipment;  !- End-Use Subcategory
-
-"""
+            process_equipment = _PROCESS_EQUIPMENT_TMPL.format(
+                process_load_w=process_load_w, heat_fraction=heat_fraction
+            )
             # Insert after the last ElectricEquipment object
             # Find position before Exterior:Lights or similar
-            insert_pattern = r"(  Exterior:Lights,)"
-            if re.search(insert_pattern, idf_content):
-                idf_content = re.sub(insert_pattern, process_equipment + r"\1", idf_content)
-            else:
+            inserted = 0
+            if "Exterior:Lights," in idf_content:
+                idf_content, inserted = _RE_EXTLIGHTS.subn(
+                    lambda m: process_equipment + m.group(1), idf_content, count=1
+                )
+            if not inserted:
                 # Fallback: append before OUTPUT section
-                insert_pattern = r"(  Output:)"
-                idf_content = re.sub(insert_pattern, process_equipment + r"\1", idf_content, count=1)
+                idf_content = _RE_OUTPUT.sub(lambda m: process_equipment + m.group(1), idf_content, count=1)
 
             modifications.append(f"Added process equipment load: {process_load_kw:.1f} kW ({heat_fraction*100:.0f}% radiant heat)")
 
@@ -471,14 +609,16 @@ class TemplateService:
 
         if cooling_sp is not None:
             # Update Cooling Return Air Setpoint Schedule
-            pattern = r"(Cooling Return Air Setpoint Schedule.*?Until: 24:00,)([0-9.-]+)(;)"
-            idf_content = re.sub(pattern, f"\\g<1>{cooling_sp}\\3", idf_content, flags=re.DOTALL)
+            # Not limited to one match: the pattern also matches from the
+            # thermostat's reference to the schedule name
+            if "Cooling Return Air Setpoint Schedule" in idf_content:
+                idf_content = _RE_COOLING_SP.sub(lambda m: f"{m.group(1)}{cooling_sp}{m.group(3)}", idf_content)
             modifications.append(f"Set cooling setpoint to {cooling_sp}°C")
 
         if heating_sp is not None:
             # Update Heating Setpoint Schedule
-            pattern = r"(Heating Setpoint Schedule.*?Until: 24:00,)([0-9.-]+)(;)"
-            idf_content = re.sub(pattern, f"\\g<1>{heating_sp}\\3", idf_content, flags=re.DOTALL)
+            if "Heating Setpoint Schedule" in idf_content:
+                idf_content = _RE_HEATING_SP.sub(lambda m: f"{m.group(1)}{heating_sp}{m.group(3)}", idf_content)
             modifications.append(f"Set heating setpoint to {heating_sp}°C")
 
         return idf_content, modifications
@@ -494,13 +634,15 @@ class TemplateService:
         sizing_run = options.get("sizing_run", False)
 
         # Find SimulationControl object and update
-        sim_control_pattern = r"(SimulationControl,.*?Run Simulation for Sizing Periods,\s*)(Yes|No)(,.*?Run Simulation for Weather File Run Periods,\s*)(Yes|No)"
-
         new_sizing = "Yes" if run_design_days else "No"
         new_weather = "Yes" if run_annual else "No"
 
-        replacement = f"\\g<1>{new_sizing}\\3{new_weather}"
-        idf_content = re.sub(sim_control_pattern, replacement, idf_content, flags=re.DOTALL)
+        if "SimulationControl," in idf_content:
+            idf_content = _RE_SIMCTRL.sub(
+                lambda m: f"{m.group(1)}{new_sizing}{m.group(3)}{new_weather}",
+                idf_content,
+                count=1
+            )
 
         modifications.append(f"Simulation: design_days={run_design_days}, annual={run_annual}")
 
@@ -510,18 +652,16 @@ class TemplateService:
         self, building_spec: Dict[str, Any], template_id: str
     ) -> str:
         """Generate metadata comment block for the IDF file"""
-        return f"""! =========================================================================
-! Generated by EnergyPlus MCP Server
-! Template: {template_id}
-! Generated: {datetime.now().isoformat()}
-! Project: {building_spec.get('project_name', 'Unknown')}
-! Project ID: {building_spec.get('project_id', 'Unknown')}
-! Location: {building_spec.get('location', {}).get('site_name', 'Unknown')}
-! =========================================================================
-
-"""
+        return _METADATA_COMMENT_TMPL % (
+            template_id,
+            datetime.now().isoformat(),
+            building_spec.get("project_name", "Unknown"),
+            building_spec.get("project_id", "Unknown"),
+            building_spec.get("location", {}).get("site_name", "Unknown"),
+        )
 
 
+@functools.lru_cache(maxsize=4)
 def get_template_service(templates_dir: Optional[str] = None) -> TemplateService:
-    """Get or create a TemplateService instance"""
+    """Get or create the shared TemplateService for a templates directory"""
     return TemplateService(templates_dir)
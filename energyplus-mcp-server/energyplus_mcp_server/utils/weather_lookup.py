@@ -9,10 +9,22 @@ any required approvals from the U.S. Dept. of Energy). All rights reserved.
 See License.txt in the parent directory for license details.
 """
 
+import asyncio
+import functools
+import hashlib
 import logging
+import os
+import re
+import shutil
+import threading
+import time
+import uuid
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, Sequence, Set, Tuple
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -29,6 +41,40 @@ PVGIS_DATABASES = {
     "PVGIS-ERA5": "Worldwide coverage (lower resolution)"
 }
 
+# Keep-alive pool for PVGIS requests; gateway errors are retried with backoff
+PVGIS_POOL_MAXSIZE = 16
+PVGIS_MAX_RETRIES = 3
+PVGIS_RETRY_BACKOFF = 0.5
+PVGIS_RETRY_STATUS_CODES = (502, 503, 504)
+
+# PVGIS TMY data for a location is effectively static, so responses are
+# cached on disk under output_dir/.cache
+PVGIS_CACHE_MAX_AGE_SECONDS = 30 * 24 * 3600
+
+# Responses are streamed to disk in chunks of this size rather than held in memory
+EPW_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Runs of characters not allowed in weather filenames (and of underscores),
+# each replaced by a single underscore
+_UNSAFE_FILENAME_CHARS = re.compile(r"(?:[^\w-]|_)+")
+
+# An EPW file has 8 header lines ahead of the hourly data rows
+EPW_HEADER_LINES = 8
+
+# Concurrent PVGIS downloads in fetch_weather_batch; kept below the pool size
+DEFAULT_BATCH_WORKERS = 8
+
+
+@functools.lru_cache(maxsize=4)
+def _get_batch_executor(max_workers: int) -> ThreadPoolExecutor:
+    """
+    Long-lived weather download pool, shared by all batch fetches.
+
+    Each worker downloads a location and then writes its fixed EPW, so one
+    location's processing overlaps the downloads of the others.
+    """
+    return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pvgis-fetch")
+
 
 class WeatherLookupError(Exception):
     """Exception raised when weather lookup fails"""
@@ -51,18 +97,60 @@ class WeatherLookup:
     https://joint-research-centre.ec.europa.eu/photovoltaic-geographical-information-system-pvgis/getting-started-pvgis/api-non-interactive-service_en
     """
 
-    def __init__(self, output_dir: str, timeout: int = 60):
+    # Output directories already created by an earlier instance
+    _ensured_dirs: Set[Path] = set()
+
+    def __init__(
+        self,
+        output_dir: str,
+        timeout: int = 60,
+        max_age: float = PVGIS_CACHE_MAX_AGE_SECONDS
+    ):
         """
         Initialize the weather lookup service.
 
         Args:
             output_dir: Directory to save downloaded weather files
             timeout: Request timeout in seconds
+            max_age: Seconds a cached PVGIS response stays valid (0 disables caching)
         """
         self.output_dir = Path(output_dir)
         self.timeout = timeout
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-        logger.info(f"WeatherLookup initialized with output_dir: {self.output_dir}")
+        self.max_age = max_age
+        if self.output_dir not in WeatherLookup._ensured_dirs:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            WeatherLookup._ensured_dirs.add(self.output_dir)
+        self._cache_dir = self.output_dir / ".cache"
+        self._cache_lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._session = self._create_session()
+        logger.debug(f"WeatherLookup initialized with output_dir: {self.output_dir}")
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Session that keeps PVGIS connections alive between lookups"""
+        retry = Retry(
+            total=PVGIS_MAX_RETRIES,
+            backoff_factor=PVGIS_RETRY_BACKOFF,
+            status_forcelist=PVGIS_RETRY_STATUS_CODES,
+            allowed_methods=frozenset(["GET"]),
+            # Hand the last error response back so its message is reported
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=PVGIS_POOL_MAXSIZE, max_retries=retry)
+        session = requests.Session()
+        session.mount(PVGIS_BASE_URL, adapter)
+        return session
+
+    def close(self):
+        """Close pooled PVGIS connections"""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def fetch_weather_by_location(
         self,
@@ -119,55 +207,29 @@ class WeatherLookup:
         if end_year:
             params["endyear"] = end_year
 
-        try:
-            # Make API request
-            response = requests.get(
-                PVGIS_TMY_ENDPOINT,
-                params=params,
-                timeout=self.timeout
-            )
-
-            # Check for errors
-            if response.status_code != 200:
-                error_msg = f"PVGIS API error: {response.status_code}"
-                try:
-                    error_data = response.json()
-                    if "message" in error_data:
-                        error_msg = f"PVGIS API error: {error_data['message']}"
-                except Exception:
-                    error_msg = f"PVGIS API error: {response.text[:200]}"
-                raise WeatherLookupError(error_msg)
-
-            # Get EPW content
-            epw_content = response.text
-
-            # Validate EPW content
-            if not epw_content.startswith("LOCATION"):
-                raise WeatherLookupError(f"Invalid EPW response from PVGIS: {epw_content[:100]}")
-
-            # Fix EPW content for EnergyPlus compatibility
-            epw_content = self._fix_epw_for_energyplus(
-                epw_content, latitude, longitude, location_name
-            )
-
-            # Generate filename
-            if location_name:
-                safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in location_name)
-                filename = f"{safe_name}_{latitude:.4f}_{longitude:.4f}.epw"
-            else:
-                filename = f"weather_{latitude:.4f}_{longitude:.4f}.epw"
+        # Generate filename
+        if location_name:
+            safe_name = _UNSAFE_FILENAME_CHARS.sub("_", location_name)
+            filename = f"{safe_name}_{latitude:.4f}_{longitude:.4f}.epw"
+        else:
+            filename = f"weather_{latitude:.4f}_{longitude:.4f}.epw"
 
-            epw_path = self.output_dir / filename
+        epw_path = self.output_dir / filename
 
-            # Save EPW file
-            with open(epw_path, "w", encoding="utf-8") as f:
-                f.write(epw_content)
+        try:
+            try:
+                metadata = self._fetch_fixed_epw(
+                    params, epw_path, latitude, longitude, location_name
+                )
+            except FileNotFoundError:
+                # The output directory was removed since it was last created
+                self.output_dir.mkdir(parents=True, exist_ok=True)
+                metadata = self._fetch_fixed_epw(
+                    params, epw_path, latitude, longitude, location_name
+                )
 
             logger.info(f"Weather file saved to: {epw_path}")
 
-            # Parse metadata from EPW header
-            metadata = self._parse_epw_header(epw_content)
-
             return {
                 "success": True,
                 "epw_path": str(epw_path),
@@ -187,15 +249,194 @@ class WeatherLookup:
         except requests.exceptions.RequestException as e:
             raise WeatherLookupError(f"Network error fetching weather data: {str(e)}")
 
+    def _fetch_fixed_epw(
+        self,
+        params: Dict[str, Any],
+        epw_path: Path,
+        latitude: float,
+        longitude: float,
+        location_name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Fetch PVGIS data and save it to epw_path fixed for EnergyPlus"""
+        raw_path, is_temporary = self._get_epw_file(params)
+        try:
+            # Save the EPW with its header fixed for EnergyPlus
+            return self._write_fixed_epw(
+                raw_path, epw_path, latitude, longitude, location_name
+            )
+        finally:
+            if is_temporary:
+                raw_path.unlink(missing_ok=True)
+
+    def _get_epw_file(self, params: Dict[str, Any]) -> Tuple[Path, bool]:
+        """
+        Raw PVGIS EPW file for a request, from the cache when still fresh.
+
+        Concurrent requests for the same parameters wait for a single
+        download instead of each fetching it.
+
+        Returns:
+            Tuple of (path, whether the file is temporary and must be removed)
+        """
+        if self.max_age <= 0:
+            path = self.output_dir / f".pvgis-{uuid.uuid4().hex}.epw"
+            self._download_epw(params, path)
+            return path, True
+
+        key = hashlib.sha1(repr(sorted(params.items())).encode()).hexdigest()
+        with self._cache_lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        path = self._cache_dir / key[:2] / key[2:4] / f"{key}.epw"
+        with key_lock:
+            try:
+                if time.time() - path.stat().st_mtime <= self.max_age:
+                    logger.debug(f"Using cached PVGIS response: {path}")
+                    return path, False
+            except OSError:
+                pass
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._download_epw(params, path)
+            return path, False
+
+    def _download_epw(self, params: Dict[str, Any], dest_path: Path):
+        """Stream TMY data from PVGIS into dest_path, replacing it once validated"""
+        tmp_path = dest_path.with_name(f"{dest_path.name}.{uuid.uuid4().hex}.tmp")
+
+        # Make API request
+        with self._session.get(
+            PVGIS_TMY_ENDPOINT,
+            params=params,
+            timeout=self.timeout,
+            stream=True
+        ) as response:
+
+            # Check for errors
+            if response.status_code != 200:
+                error_msg = f"PVGIS API error: {response.status_code}"
+                try:
+                    error_data = response.json()
+                    if "message" in error_data:
+                        error_msg = f"PVGIS API error: {error_data['message']}"
+                except Exception:
+                    error_msg = f"PVGIS API error: {response.text[:200]}"
+                raise WeatherLookupError(error_msg)
+
+            try:
+                head = b""
+                with open(tmp_path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=EPW_DOWNLOAD_CHUNK_SIZE):
+                        if len(head) < 100:
+                            head += chunk[:100 - len(head)]
+                        f.write(chunk)
+
+                # Validate EPW content
+                if not head.startswith(b"LOCATION"):
+                    raise WeatherLookupError(
+                        f"Invalid EPW response from PVGIS: {head.decode('utf-8', 'replace')}"
+                    )
+                os.replace(tmp_path, dest_path)
+            finally:
+                tmp_path.unlink(missing_ok=True)
+
+    def _write_fixed_epw(
+        self,
+        raw_path: Path,
+        epw_path: Path,
+        latitude: float,
+        longitude: float,
+        location_name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Write a PVGIS EPW fixed for EnergyPlus and return its header metadata.
+
+        Only the header lines are read and rewritten; the hourly data rows
+        are copied through unchanged as bytes.
+        """
+        tmp_path = epw_path.with_name(f"{epw_path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            with open(raw_path, "rb") as src, open(tmp_path, "wb") as dst:
+                header = []
+                ends_in_header = False
+                for _ in range(EPW_HEADER_LINES):
+                    # Undecodable bytes are replaced, as response.text did
+                    line = src.readline().decode("utf-8", "replace")
+                    if not line.endswith("\n"):
+                        header.append(line)
+                        ends_in_header = True
+                        break
+                    header.append(line[:-1])
+
+                header = self._fix_epw_for_energyplus(header, latitude, longitude, location_name)
+                dst.write("\n".join(header).encode("utf-8"))
+                if not ends_in_header:
+                    dst.write(b"\n")
+                    shutil.copyfileobj(src, dst, EPW_DOWNLOAD_CHUNK_SIZE)
+            os.replace(tmp_path, epw_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+        return self._parse_epw_header(header)
+
+    def fetch_weather_batch(
+        self,
+        locations: Sequence[Tuple],
+        max_workers: int = DEFAULT_BATCH_WORKERS
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch weather data for several locations concurrently.
+
+        Downloads run on a thread pool over the shared PVGIS session, so the
+        total time is close to that of the slowest request rather than the
+        sum of all of them.
+
+        Args:
+            locations: (latitude, longitude) or (latitude, longitude, name) tuples
+            max_workers: Maximum number of concurrent PVGIS requests
+
+        Returns:
+            One result per location, in input order. Each is the
+            fetch_weather_by_location result, or a dict with success=False and
+            the error message if that location failed.
+        """
+        if not locations:
+            return []
+
+        def fetch_one(location: Tuple) -> Dict[str, Any]:
+            latitude, longitude = location[0], location[1]
+            location_name = location[2] if len(location) > 2 else None
+            try:
+                return self.fetch_weather_by_location(latitude, longitude, location_name)
+            except WeatherLookupError as e:
+                return {
+                    "success": False,
+                    "location": {"latitude": latitude, "longitude": longitude, "name": location_name},
+                    "error": str(e)
+                }
+
+        return list(_get_batch_executor(max_workers).map(fetch_one, locations))
+
+    async def fetch_weather_batch_async(
+        self,
+        locations: Sequence[Tuple],
+        max_workers: int = DEFAULT_BATCH_WORKERS
+    ) -> List[Dict[str, Any]]:
+        """
+        Awaitable fetch_weather_batch for async (FastAPI/MCP) handlers.
+
+        Arguments and result are as for fetch_weather_batch.
+        """
+        return await asyncio.to_thread(self.fetch_weather_batch, locations, max_workers)
+
     def _fix_epw_for_energyplus(
         self,
-        epw_content: str,
+        header_lines: List[str],
         latitude: float,
         longitude: float,
         location_name: Optional[str] = None
-    ) -> str:
+    ) -> List[str]:
         """
-        Fix PVGIS EPW content for EnergyPlus compatibility.
+        Fix PVGIS EPW header lines for EnergyPlus compatibility.
 
         PVGIS EPW files have some formatting issues that cause EnergyPlus to fail:
         1. LOCATION line has 'unknown' for city/state/country
@@ -203,21 +444,20 @@ class WeatherLookup:
         3. Missing timezone offset
 
         Args:
-            epw_content: Raw EPW content from PVGIS
+            header_lines: Raw EPW header lines from PVGIS
             latitude: Latitude used for the request
             longitude: Longitude used for the request
             location_name: Optional location name
 
         Returns:
-            Fixed EPW content string
+            Fixed EPW header lines
         """
-        lines = epw_content.split("\n")
         fixed_lines = []
 
         # Calculate timezone from longitude (approximate)
         timezone = round(longitude / 15)
 
-        for line in lines:
+        for line in header_lines:
             if line.startswith("LOCATION"):
                 # Fix LOCATION line
                 # Format: LOCATION,City,State,Country,Source,WMO,Lat,Lon,TZ,Elev
@@ -254,14 +494,13 @@ class WeatherLookup:
             else:
                 fixed_lines.append(line)
 
-        return "\n".join(fixed_lines)
+        return fixed_lines
 
-    def _parse_epw_header(self, epw_content: str) -> Dict[str, Any]:
-        """Parse metadata from EPW file header"""
+    def _parse_epw_header(self, header_lines: List[str]) -> Dict[str, Any]:
+        """Parse metadata from EPW file header lines"""
         metadata = {}
-        lines = epw_content.split("\n")
 
-        for line in lines[:8]:  # Header is first 8 lines
+        for line in header_lines:
             if line.startswith("LOCATION"):
                 parts = line.split(",")
                 if len(parts) >= 10:
@@ -344,6 +583,44 @@ class WeatherLookup:
         return coverage
 
 
+    def check_locations_coverage(self, latlons) -> Dict[str, Any]:
+        """
+        Check PVGIS database coverage for many locations at once.
+
+        Vectorized form of check_location_coverage: the same bounding boxes
+        are evaluated for all locations with NumPy comparisons.
+
+        Args:
+            latlons: Array-like of shape (N, 2) with latitude, longitude rows
+
+        Returns:
+            Dict of length-N arrays: per-database boolean coverage masks
+            ("PVGIS-SARAH3", "PVGIS-NSRDB", "PVGIS-ERA5") and
+            "recommended_database" names, in the same precedence as
+            check_location_coverage
+        """
+        import numpy as np
+
+        latlons = np.asarray(latlons, dtype=np.float64).reshape(-1, 2)
+        latitude = latlons[:, 0]
+        longitude = latlons[:, 1]
+
+        sarah3 = (latitude >= -35) & (latitude <= 65) & (longitude >= -20) & (longitude <= 70)
+        nsrdb = (latitude >= -20) & (longitude >= -170) & (longitude <= -20)
+        era5 = np.ones(len(latlons), dtype=bool)
+
+        recommended = np.where(
+            sarah3, "PVGIS-SARAH3", np.where(nsrdb, "PVGIS-NSRDB", "PVGIS-ERA5")
+        )
+
+        return {
+            "PVGIS-SARAH3": sarah3,
+            "PVGIS-NSRDB": nsrdb,
+            "PVGIS-ERA5": era5,
+            "recommended_database": recommended
+        }
+
+
 def get_weather_for_location(
     latitude: float,
     longitude: float,
@@ -362,9 +639,9 @@ def get_weather_for_location(
     Returns:
         Dict with weather file path and metadata
     """
-    lookup = WeatherLookup(output_dir)
-    return lookup.fetch_weather_by_location(
-        latitude=latitude,
-        longitude=longitude,
-        location_name=location_name
-    )
+    with WeatherLookup(output_dir) as lookup:
+        return lookup.fetch_weather_by_location(
+            latitude=latitude,
+            longitude=longitude,
+            location_name=location_name
+        )
@@ -31,9 +31,16 @@ import sys
 import json
 import time
 import argparse
+import http.client
 import urllib.request
 from datetime import datetime
 from pathlib import Path
+from urllib.parse import urlsplit
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 # Configuration
 NGROK_API_URL = "http://127.0.0.1:4040/api/tunnels"
@@ -41,32 +48,99 @@ DEFAULT_SHEET_ID = os.environ.get("NGROK_CONFIG_SHEET_ID", "")
 CREDENTIALS_PATH = os.environ.get("GOOGLE_SHEETS_CREDENTIALS", "")
 CONFIG_FILE = Path(__file__).parent.parent / "config" / "ngrok_url.txt"
 
+# Watch mode doubles its poll interval while the URL is unchanged, up to this cap
+MAX_POLL_INTERVAL = 300
 
-def get_ngrok_url() -> str | None:
-    """Get the current ngrok public URL from the local API."""
+# A URL found less than this many seconds ago is returned without asking ngrok again
+NGROK_URL_TTL = 1.0
+
+# Keep-alive connection to the ngrok API, reused across polls
+_ngrok_conn: http.client.HTTPConnection | None = None
+_last_url: tuple[float, str] | None = None
+
+# gspread and google-auth are imported on first Sheets update only; the
+# authorized client is kept until the credentials file changes, and opened
+# worksheets are kept by sheet ID
+_gspread_modules: tuple | None = None
+_gspread_client: tuple[tuple[str, int], object] | None = None
+_worksheets: dict = {}
+
+
+def _request_ngrok_tunnels() -> http.client.HTTPResponse:
+    """GET the ngrok tunnels list over the shared keep-alive connection."""
+    global _ngrok_conn
+    api = urlsplit(NGROK_API_URL)
+    for attempt in range(2):
+        if _ngrok_conn is None:
+            _ngrok_conn = http.client.HTTPConnection(api.hostname, api.port, timeout=2)
+        try:
+            _ngrok_conn.request("GET", api.path)
+            response = _ngrok_conn.getresponse()
+        except (http.client.HTTPException, OSError):
+            # The kept-alive socket may have been closed; retry once on a new one
+            _ngrok_conn.close()
+            _ngrok_conn = None
+            if attempt:
+                raise
+            continue
+        if response.status != 200:
+            response.read()
+            raise http.client.HTTPException(f"HTTP {response.status} {response.reason}")
+        return response
+
+
+def _find_ngrok_url() -> str | None:
+    """
+    Public URL of the first HTTPS tunnel, else of the first tunnel.
+
+    With ijson installed the tunnels are parsed one at a time and parsing
+    stops at the first HTTPS tunnel.
+    """
+    response = _request_ngrok_tunnels()
     try:
-        with urllib.request.urlopen(NGROK_API_URL, timeout=2) as response:
-            data = json.loads(response.read().decode())
-            tunnels = data.get("tunnels", [])
+        if ijson is not None:
+            tunnels = ijson.items(response, "tunnels.item")
+        else:
+            tunnels = json.loads(response.read()).get("tunnels", [])
 
+        first = None
+        for tunnel in tunnels:
             # Prefer HTTPS tunnel
-            for tunnel in tunnels:
-                if tunnel.get("proto") == "https":
-                    return tunnel["public_url"]
+            if tunnel.get("proto") == "https":
+                return tunnel["public_url"]
+            if first is None:
+                first = tunnel
 
-            # Fall back to first tunnel
-            if tunnels:
-                return tunnels[0]["public_url"]
+        # Fall back to first tunnel
+        return first["public_url"] if first is not None else None
+    finally:
+        # Drain the rest of the body so the connection can be reused
+        response.read()
 
-            return None
+
+def get_ngrok_url() -> str | None:
+    """Get the current ngrok public URL from the local API."""
+    global _last_url
+    if _last_url and time.monotonic() - _last_url[0] < NGROK_URL_TTL:
+        return _last_url[1]
+
+    try:
+        url = _find_ngrok_url()
     except Exception as e:
         print(f"Error getting ngrok URL: {e}")
         return None
 
+    if url:
+        _last_url = (time.monotonic(), url)
+    return url
+
 
 def update_local_config(url: str) -> bool:
     """Update the local config file with the ngrok URL."""
     try:
+        if CONFIG_FILE.exists() and CONFIG_FILE.read_text() == url:
+            print(f"Local config already up to date: {CONFIG_FILE}")
+            return True
         CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
         CONFIG_FILE.write_text(url)
         print(f"Updated local config: {CONFIG_FILE}")
@@ -76,6 +150,34 @@ def update_local_config(url: str) -> bool:
         return False
 
 
+def _load_gspread() -> tuple | None:
+    """Import gspread and the service-account Credentials class once."""
+    global _gspread_modules
+    if _gspread_modules is None:
+        try:
+            import gspread
+            from google.oauth2.service_account import Credentials
+        except ImportError:
+            return None
+        _gspread_modules = (gspread, Credentials)
+    return _gspread_modules
+
+
+def _get_gspread_client(gspread, Credentials):
+    """Authorized gspread client, reused while the credentials file is unchanged."""
+    global _gspread_client
+    key = (CREDENTIALS_PATH, os.stat(CREDENTIALS_PATH).st_mtime_ns)
+    if _gspread_client is None or _gspread_client[0] != key:
+        scopes = [
+            "https://www.googleapis.com/auth/spreadsheets",
+            "https://www.googleapis.com/auth/drive"
+        ]
+        creds = Credentials.from_service_account_file(CREDENTIALS_PATH, scopes=scopes)
+        _gspread_client = (key, gspread.authorize(creds))
+        _worksheets.clear()
+    return _gspread_client[1]
+
+
 def update_google_sheet_gspread(url: str, sheet_id: str) -> bool:
     """
     Update Google Sheet using gspread library.
@@ -83,10 +185,8 @@ def update_google_sheet_gspread(url: str, sheet_id: str) -> bool:
     Requires:
         pip install gspread google-auth
     """
-    try:
-        import gspread
-        from google.oauth2.service_account import Credentials
-    except ImportError:
+    modules = _load_gspread()
+    if modules is None:
         print("gspread not installed. Run: pip install gspread google-auth")
         return False
 
@@ -96,23 +196,33 @@ def update_google_sheet_gspread(url: str, sheet_id: str) -> bool:
         return False
 
     try:
-        # Authenticate
-        scopes = [
-            "https://www.googleapis.com/auth/spreadsheets",
-            "https://www.googleapis.com/auth/drive"
-        ]
-        creds = Credentials.from_service_account_file(CREDENTIALS_PATH, scopes=scopes)
-        client = gspread.authorize(creds)
-
-        # Open sheet and update
-        sheet = client.open_by_key(sheet_id).sheet1
-        sheet.update_acell("B1", url)
-        sheet.update_acell("B2", datetime.now().isoformat())
+        # Authenticate (once per credentials file) and open the sheet
+        client = _get_gspread_client(*modules)
+        sheet = _worksheets.get(sheet_id)
+        if sheet is None:
+            sheet = client.open_by_key(sheet_id).sheet1
+            _worksheets[sheet_id] = sheet
+
+        # A read is cheaper than a write against the Sheets quota
+        if sheet.acell("B1").value == url:
+            print(f"Google Sheet already up to date: {url}")
+            return True
+
+        # Write the URL and timestamp in one request
+        sheet.batch_update(
+            [
+                {"range": "B1", "values": [[url]]},
+                {"range": "B2", "values": [[datetime.now().isoformat()]]}
+            ],
+            value_input_option="USER_ENTERED"
+        )
 
         print(f"Updated Google Sheet: {url}")
         return True
 
     except Exception as e:
+        # Reopen the sheet next time in case the session went bad
+        _worksheets.pop(sheet_id, None)
         print(f"Error updating Google Sheet: {e}")
         return False
 
@@ -161,12 +271,19 @@ def update_google_sheet_apps_script(url: str, webhook_url: str) -> bool:
         return False
 
 
-def watch_and_update(sheet_id: str, interval: int = 30):
-    """Watch for ngrok URL changes and update sheet."""
-    print(f"Watching for ngrok URL changes (interval: {interval}s)...")
+def watch_and_update(sheet_id: str, interval: int = 30, max_interval: int = MAX_POLL_INTERVAL):
+    """
+    Watch for ngrok URL changes and update sheet.
+
+    Polls every `interval` seconds after a change, backing off by doubling
+    the wait while the URL stays the same, up to `max_interval`.
+    """
+    max_interval = max(interval, max_interval)
+    print(f"Watching for ngrok URL changes (interval: {interval}-{max_interval}s)...")
     print("Press Ctrl+C to stop")
 
     last_url = None
+    current_interval = interval
 
     while True:
         try:
@@ -180,8 +297,11 @@ def watch_and_update(sheet_id: str, interval: int = 30):
                     update_google_sheet_gspread(current_url, sheet_id)
 
                 last_url = current_url
+                current_interval = interval
+            else:
+                current_interval = min(current_interval * 2, max_interval)
 
-            time.sleep(interval)
+            time.sleep(current_interval)
 
         except KeyboardInterrupt:
             print("\nStopping watch...")
@@ -208,6 +328,12 @@ def main():
         default=30,
         help="Check interval in seconds (default: 30)"
     )
+    parser.add_argument(
+        "--max-interval",
+        type=int,
+        default=MAX_POLL_INTERVAL,
+        help=f"Longest check interval while the URL is unchanged (default: {MAX_POLL_INTERVAL})"
+    )
     parser.add_argument(
         "--apps-script-url",
         help="Apps Script web app URL (alternative to service account)"
@@ -239,7 +365,7 @@ def main():
 
     # Watch mode
     if args.watch:
-        watch_and_update(args.sheet_id, args.interval)
+        watch_and_update(args.sheet_id, args.interval, args.max_interval)
         return
 
     # One-time update
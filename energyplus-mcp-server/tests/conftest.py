@@ -0,0 +1,26 @@
+"""
+Shared fixtures for the EnergyPlus MCP Server tests
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from energyplus_mcp_server import config
+from energyplus_mcp_server.http_server import app
+
+
+@pytest.fixture
+def outputs_dir(tmp_path, monkeypatch):
+    """Empty outputs directory, configured as the one the file endpoints may read"""
+    monkeypatch.setenv("MCP_WORKSPACE_ROOT", str(tmp_path))
+    monkeypatch.setenv("MCP_OUTPUT_DIR", str(tmp_path / "outputs"))
+    config.reload_config()
+    yield tmp_path / "outputs"
+    # Rebuilt from the restored environment on next use
+    config._CONFIG = None
+
+
+@pytest.fixture
+def client():
+    """HTTP client for the FastAPI app (startup hooks are not run)"""
+    return TestClient(app)
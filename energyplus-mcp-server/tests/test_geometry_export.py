@@ -0,0 +1,95 @@
+"""
+Tests for energyplus_mcp_server.utils.geometry_export
+"""
+
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+pytest.importorskip("geomeppy")
+trimesh = pytest.importorskip("trimesh")
+
+from energyplus_mcp_server.utils.geometry_export import (  # noqa: E402
+    GeometryExportService,
+    _convex_mask,
+    _fan_triangles,
+    _prune_glb_cache,
+    _triangulate,
+)
+
+TEMPLATES = sorted((Path(__file__).parent.parent / "templates").glob("*/*.idf"))
+
+# Parsing the bundled templates needs the EnergyPlus IDD they were written for
+IDD_PATH = os.environ.get("EPLUS_IDD_PATH", "")
+needs_idd = pytest.mark.skipif(
+    not os.path.exists(IDD_PATH), reason="EPLUS_IDD_PATH does not name an EnergyPlus IDD"
+)
+
+
+def test_triangulate_covers_concave_polygon():
+    """An L-shaped floor is covered exactly, with no triangle across the notch"""
+    # Starting next to the notch, so a fan from the first vertex would cross it
+    polygon = np.array(
+        [(4, 2, 0), (2, 2, 0), (2, 4, 0), (0, 4, 0), (0, 0, 0), (4, 0, 0)], dtype=float
+    )
+    triangles = polygon[_triangulate(polygon)]
+    assert len(triangles) == 4
+    assert trimesh.triangles.area(triangles).sum() == pytest.approx(12.0)
+
+
+def test_only_convex_polygons_are_fan_triangulated():
+    """Concave, self-intersecting and degenerate polygons are not taken for convex"""
+    star = [(np.cos(a), np.sin(a), 0) for a in np.arange(5) * 4 * np.pi / 5]
+    polygons = [
+        [(0, 0, 0), (0, 0, 3), (5, 0, 3), (5, 0, 0)],             # wall
+        [(0, 0, 0), (1, 0, 0), (2, 0, 0), (2, 1, 0), (0, 1, 0)],  # collinear vertex
+        [(4, 2, 0), (2, 2, 0), (2, 4, 0), (0, 4, 0), (0, 0, 0), (4, 0, 0)],  # L
+        star,
+        [(0, 0, 0), (1, 0, 0), (2, 0, 0)],                        # no area
+    ]
+    points = np.concatenate([np.asarray(p, dtype=float) for p in polygons])
+    sizes = np.array([len(p) for p in polygons])
+    offsets = np.cumsum(sizes) - sizes
+
+    convex = _convex_mask(points, sizes, offsets)
+    assert convex.tolist() == [True, True, False, False, False]
+    assert _fan_triangles(sizes[convex], offsets[convex]).tolist() == [
+        [0, 1, 2], [0, 2, 3], [4, 5, 6], [4, 6, 7], [4, 7, 8]
+    ]
+
+
+def test_prune_glb_cache_removes_least_recently_used(tmp_path):
+    """Cached .glb files are removed oldest-mtime first until the cache fits"""
+    for age, name in enumerate(["new", "middle", "old"]):
+        path = tmp_path / f"{name}.glb"
+        path.write_bytes(b"x" * 100)
+        mtime = 1_700_000_000 - age * 60
+        os.utime(path, (mtime, mtime))
+
+    _prune_glb_cache(tmp_path, 250)
+    assert sorted(path.stem for path in tmp_path.iterdir()) == ["middle", "new"]
+
+    _prune_glb_cache(tmp_path, 250)
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+@needs_idd
+@pytest.mark.parametrize("idf_path", TEMPLATES, ids=lambda path: path.stem)
+def test_built_mesh_matches_obj_route(idf_path, tmp_path):
+    """The in-memory mesh has the faces, area, bounds and colours of the to_obj route"""
+    service = GeometryExportService(idd_path=IDD_PATH)
+    built = service._build_mesh(idf_path)
+    loaded = service._load_obj_mesh(service._write_obj(idf_path, tmp_path, idf_path.stem))
+
+    assert set(built.geometry) == set(loaded.geometry)
+    for name, geometry in loaded.geometry.items():
+        assert len(built.geometry[name].faces) == len(geometry.faces)
+        assert built.geometry[name].area == pytest.approx(geometry.area, rel=1e-6)
+        if isinstance(geometry.visual, trimesh.visual.TextureVisuals):
+            np.testing.assert_array_equal(
+                built.geometry[name].visual.material.diffuse,
+                geometry.visual.material.diffuse
+            )
+    np.testing.assert_allclose(built.bounds, loaded.bounds, atol=1e-5)
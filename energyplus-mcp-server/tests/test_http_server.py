@@ -0,0 +1,115 @@
+"""
+Tests for the HTTP API response contracts in energyplus_mcp_server.http_server
+"""
+
+import time
+
+import numpy as np
+
+from energyplus_mcp_server import http_server
+
+
+def test_filename_timestamp_suffixes_repeats_within_a_second(monkeypatch):
+    """Filenames issued in the same second get _1, _2, ... so they do not collide"""
+    now = 1736087400.25
+    monkeypatch.setattr(http_server, "_timestamp_second", 0)
+    monkeypatch.setattr(http_server, "_timestamp_count", 0)
+    monkeypatch.setattr(http_server.time, "time", lambda: now)
+
+    base = time.strftime("%Y%m%d_%H%M%S", time.localtime(int(now)))
+    assert http_server._filename_timestamp() == base
+    assert http_server._filename_timestamp() == f"{base}_1"
+    assert http_server._filename_timestamp() == f"{base}_2"
+
+    # The count restarts in the next second
+    now += 1
+    assert http_server._filename_timestamp() == time.strftime(
+        "%Y%m%d_%H%M%S", time.localtime(int(now))
+    )
+
+
+def test_orjson_response_serializes_numpy_arrays():
+    """NumPy columns and non-string keys render without a conversion pass"""
+    response = http_server.ORJSONResponse(
+        {"data": {"kWh": np.array([1.5, 2.0]), "count": np.arange(2)}, 1: "one"}
+    )
+    assert response.body == b'{"data":{"kWh":[1.5,2.0],"count":[0,1]},"1":"one"}'
+    assert response.media_type == "application/json"
+
+
+def _write_lines(path, count):
+    path.write_text("".join(f"line {i}\n" for i in range(count)))
+    return str(path)
+
+
+def test_read_file_reports_total_lines_only_when_not_truncated(outputs_dir, client):
+    """total_lines is null for a truncated read unless count_lines is set"""
+    file_path = _write_lines(outputs_dir / "eplusout.err", 10)
+
+    body = client.get("/api/files/read", params={"file_path": file_path, "max_lines": 3}).json()
+    assert body["truncated"] is True
+    assert body["total_lines"] is None
+    assert body["content"] == "line 0\nline 1\nline 2\n"
+
+    body = client.get(
+        "/api/files/read",
+        params={"file_path": file_path, "max_lines": 3, "count_lines": True}
+    ).json()
+    assert body["truncated"] is True
+    assert body["total_lines"] == 10
+
+    body = client.get("/api/files/read", params={"file_path": file_path, "max_lines": 20}).json()
+    assert body["truncated"] is False
+    assert body["total_lines"] == 10
+
+
+def test_read_file_streamed_response_has_the_same_fields(outputs_dir, client):
+    """Large reads are streamed but decode to the same JSON document"""
+    file_path = _write_lines(outputs_dir / "eplusout.eso", 700)
+    max_lines = http_server._STREAM_MIN_LINES + 1
+
+    body = client.get(
+        "/api/files/read", params={"file_path": file_path, "max_lines": max_lines}
+    ).json()
+    assert body["success"] is True
+    assert body["file_name"] == "eplusout.eso"
+    assert body["truncated"] is True
+    assert body["total_lines"] is None
+    assert body["content"].count("\n") == max_lines
+
+    body = client.get(
+        "/api/files/read",
+        params={"file_path": file_path, "max_lines": max_lines, "count_lines": True}
+    ).json()
+    assert body["total_lines"] == 700
+
+
+def test_simulation_results_timeseries_is_column_oriented(outputs_dir, client):
+    """Time series come back as {"columns", "data"} and follow changes to the meter CSV"""
+    (outputs_dir / "eplusout.end").write_text("EnergyPlus Completed Successfully")
+    meter_csv = outputs_dir / "eplusMeter.csv"
+    meter_csv.write_text(
+        "Date/Time,Electricity:Facility [J](Hourly)\n"
+        " 01/01  01:00:00,100.5\n"
+        " 01/01  02:00:00,200.0\n"
+    )
+    params = {"output_directory": str(outputs_dir), "include_timeseries": True}
+
+    body = client.get("/api/simulation/results", params=params).json()
+    assert body["timeseries"] == {
+        "columns": ["Date/Time", "Electricity:Facility [J](Hourly)"],
+        "data": {
+            "Date/Time": [" 01/01  01:00:00", " 01/01  02:00:00"],
+            "Electricity:Facility [J](Hourly)": [100.5, 200.0],
+        },
+    }
+    assert body["summary"]["energy_totals"] == {
+        "Electricity:Facility [J](Hourly)": {"total": 300.5, "unit": "J"}
+    }
+
+    # Cached results are dropped once the meter file changes
+    with open(meter_csv, "a") as f:
+        f.write(" 01/01  03:00:00,50.0\n")
+    body = client.get("/api/simulation/results", params=params).json()
+    assert body["timeseries"]["data"]["Electricity:Facility [J](Hourly)"] == [100.5, 200.0, 50.0]
+    assert body["summary"]["energy_totals"]["Electricity:Facility [J](Hourly)"]["total"] == 350.5
@@ -0,0 +1,30 @@
+"""
+Tests for energyplus_mcp_server.utils.weather_lookup
+"""
+
+from energyplus_mcp_server.utils.weather_lookup import WeatherLookup
+
+
+def test_write_fixed_epw_tolerates_non_utf8_header(tmp_path):
+    """Undecodable header bytes are replaced and the data rows copied unchanged"""
+    header = (
+        b"LOCATION,Zurich,-,CHE,PVGIS,unknown,47.37,8.54,0,408\n"
+        b"DESIGN CONDITIONS,0\n"
+        b"TYPICAL/EXTREME PERIODS,0\n"
+        b"GROUND TEMPERATURES,0\n"
+        b"HOLIDAYS/DAYLIGHT SAVINGS,No,0,0,0\n"
+        b"COMMENTS 1,PVGIS Z\xfcrich\n"
+        b"COMMENTS 2,\n"
+        b"DATA PERIODS,1,1,Data,Sunday,1/1,12/31\n"
+    )
+    rows = b"1990,1,1,1,0,*,-1.2,\xff\n"
+    raw_path = tmp_path / "raw.epw"
+    raw_path.write_bytes(header + rows)
+
+    lookup = WeatherLookup(output_dir=str(tmp_path), max_age=0)
+    metadata = lookup._write_fixed_epw(raw_path, tmp_path / "fixed.epw", 47.37, 8.54)
+
+    assert metadata["latitude"] == 47.37
+    written = (tmp_path / "fixed.epw").read_bytes()
+    assert written.endswith(rows)
+    assert metadata["comments1"] == "PVGIS Z\ufffdrich"